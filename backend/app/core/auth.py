@@ -1,8 +1,18 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import asyncio
+import hashlib
 import jwt
+import logging
 import os
+import time
 import httpx
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
 
 security = HTTPBearer()
 
@@ -10,47 +20,159 @@ CLERK_ISSUER = os.getenv("CLERK_ISSUER")
 CLERK_AUDIENCE = os.getenv("CLERK_AUDIENCE")
 CLERK_JWKS_URL = f"{CLERK_ISSUER}/.well-known/jwks.json"
 
-_jwks_cache = None
-
-
-async def get_jwks():
-    global _jwks_cache
-    if _jwks_cache:
-        return _jwks_cache
-
-    async with httpx.AsyncClient() as client:
-        res = await client.get(CLERK_JWKS_URL)
-        res.raise_for_status()
-        _jwks_cache = res.json()
-        return _jwks_cache
+# Keys older than this are refreshed in the background (still served meanwhile)
+JWKS_TTL = int(os.getenv("JWKS_TTL", 3600))
+# Minimum seconds between refetches triggered by an unknown kid (forged tokens can't hammer Clerk)
+JWKS_MIN_REFETCH_INTERVAL = int(os.getenv("JWKS_MIN_REFETCH_INTERVAL", 30))
+
+
+class JWKSManager:
+    """
+    Clerk signing keys indexed by kid, parsed once per fetch.
+    - Stale keys are served while a background refresh runs
+    - Concurrent fetches are coalesced into one request
+    - An unknown kid (key rotation) triggers a rate-limited refetch
+    If a refresh fails the previous keys stay in use.
+    """
+
+    def __init__(self, url: str, ttl: int, min_refetch_interval: int):
+        self.url = url
+        self.ttl = ttl
+        self.min_refetch_interval = min_refetch_interval
+        self._keys: Dict[str, Any] = {}
+        self._fetched_at = 0.0
+        self._last_attempt = float("-inf")
+        self._flight = SingleFlight()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def _fetch(self) -> Dict[str, Any]:
+        self._last_attempt = time.monotonic()
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            res = await client.get(self.url)
+            res.raise_for_status()
+            jwks = res.json()
+
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            kid = jwk.get("kid")
+            if not kid:
+                continue
+            try:
+                keys[kid] = jwt.PyJWK(jwk).key
+            except jwt.PyJWTError as e:
+                logger.warning(f"[JWKS] skipping unusable key {kid}: {e}")
+
+        if not keys:
+            raise ValueError("JWKS response contained no usable keys")
+
+        # Swap the whole index at once: readers never see a partial set
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        logger.info(f"[JWKS] loaded {len(keys)} keys")
+        return keys
+
+    async def refresh(self) -> Dict[str, Any]:
+        return await self._flight.do("jwks", self._fetch)
+
+    def _schedule_refresh(self):
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"[JWKS] background refresh failed, keeping current keys: {e}")
+
+    async def get_key(self, kid: str) -> Any:
+        """Parsed public key for kid; raises KeyError if Clerk doesn't publish it."""
+        if not self._keys:
+            await self.refresh()
+        elif time.monotonic() - self._fetched_at > self.ttl:
+            self._schedule_refresh()
+
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._last_attempt >= self.min_refetch_interval:
+            # Possibly a freshly rotated key: refetch (rate limited)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"[JWKS] refetch for unknown kid failed: {e}")
+            key = self._keys.get(kid)
+
+        if key is None:
+            raise KeyError(f"Unknown signing key: {kid}")
+        return key
+
+
+jwks_manager = JWKSManager(CLERK_JWKS_URL, JWKS_TTL, JWKS_MIN_REFETCH_INTERVAL)
+
+
+# --------------------------------------------------
+# VERIFIED TOKEN CACHE
+# --------------------------------------------------
+# sha256(token) -> (exp, user); a repeat token skips RS256 verification until it expires
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 4096))
+_verified_tokens: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+
+
+def _cached_user(token_hash: str) -> Optional[Dict]:
+    entry = _verified_tokens.get(token_hash)
+    if entry is None:
+        return None
+    exp, user = entry
+    if exp <= time.time():
+        del _verified_tokens[token_hash]
+        return None
+    _verified_tokens.move_to_end(token_hash)
+    # Copy so a caller mutating its user can't alter the cached entry
+    return dict(user)
+
+
+def _cache_user(token_hash: str, exp: float, user: Dict):
+    _verified_tokens[token_hash] = (exp, user)
+    _verified_tokens.move_to_end(token_hash)
+    while len(_verified_tokens) > TOKEN_CACHE_SIZE:
+        _verified_tokens.popitem(last=False)
+
+
+async def _verify_token(token: str) -> Dict:
+    """
+    Verify a Clerk session token and return the user it identifies.
+    Raises on any invalid, expired or unverifiable token.
+    """
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    user = _cached_user(token_hash)
+    if user is not None:
+        return user
+
+    header = jwt.get_unverified_header(token)
+    key = await jwks_manager.get_key(header["kid"])
+
+    payload = jwt.decode(
+        token,
+        key,
+        algorithms=["RS256"],
+        audience=CLERK_AUDIENCE,
+        issuer=CLERK_ISSUER,
+    )
+
+    user = {
+        "user_id": payload["sub"],
+        "email": payload.get("email"),
+    }
+    if "exp" in payload:
+        _cache_user(token_hash, float(payload["exp"]), user)
+    # Same copy rule as _cached_user: the stored dict is never handed out
+    return dict(user)
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
-    token = credentials.credentials
-
     try:
-        jwks = await get_jwks()
-        header = jwt.get_unverified_header(token)
-
-        key = next(
-            k for k in jwks["keys"] if k["kid"] == header["kid"]
-        )
-
-        payload = jwt.decode(
-            token,
-            key,
-            algorithms=["RS256"],
-            audience=CLERK_AUDIENCE,
-            issuer=CLERK_ISSUER,
-        )
-
-        return {
-            "user_id": payload["sub"],
-            "email": payload.get("email"),
-        }
-
+        return await _verify_token(credentials.credentials)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -64,27 +186,8 @@ async def get_current_user_optional(
     """Optional authentication - returns demo user if not authenticated"""
     if not credentials:
         return {"user_id": "demo_user", "email": "demo@example.com"}
-    
-    try:
-        token = credentials.credentials
-        jwks = await get_jwks()
-        header = jwt.get_unverified_header(token)
 
-        key = next(
-            k for k in jwks["keys"] if k["kid"] == header["kid"]
-        )
-
-        payload = jwt.decode(
-            token,
-            key,
-            algorithms=["RS256"],
-            audience=CLERK_AUDIENCE,
-            issuer=CLERK_ISSUER,
-        )
-
-        return {
-            "user_id": payload["sub"],
-            "email": payload.get("email"),
-        }
+    try:
+        return await _verify_token(credentials.credentials)
     except Exception:
         return {"user_id": "demo_user", "email": "demo@example.com"}
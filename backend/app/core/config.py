@@ -23,11 +23,64 @@ class Settings:
     # GNEWS CONFIG (ONLY SOURCE)
     # -----------------------------
     GNEWS_API_KEY: str = os.getenv("GNEWS_API_KEY", "")
-    GNEWS_BASE_URL: str = "https://gnews.io/api/v4"
+    # Point at tools/fake_gnews.py (e.g. http://127.0.0.1:8800/api/v4) for offline/load testing
+    GNEWS_BASE_URL: str = os.getenv("GNEWS_BASE_URL", "https://gnews.io/api/v4")
+    # Free tier is 100/day; raise only when GNEWS_BASE_URL points at the fake server
+    GNEWS_DAILY_LIMIT: int = int(os.getenv("GNEWS_DAILY_LIMIT", 100))
+
+    # -----------------------------
+    # CPU WORKER POOL
+    # -----------------------------
+    # Processes for CPU-bound work (HTML parsing, summarization); 0 = run in a thread instead
+    CPU_WORKERS: int = int(os.getenv("CPU_WORKERS", min(4, os.cpu_count() or 1)))
+    # Max queued + running CPU jobs before new ones are rejected (callers fall back)
+    CPU_QUEUE_LIMIT: int = int(os.getenv("CPU_QUEUE_LIMIT", 64))
+
+    # -----------------------------
+    # ARTICLE SCRAPING
+    # -----------------------------
+    # Stop reading publisher pages after this many bytes
+    ARTICLE_MAX_BYTES: int = int(os.getenv("ARTICLE_MAX_BYTES", 2_000_000))
+    # Skip scraping a domain after this many consecutive failures (paywalls, bot blocks)
+    SCRAPE_BLOCK_AFTER: int = int(os.getenv("SCRAPE_BLOCK_AFTER", 3))
+    # First skip window in seconds; doubles after every failed probe, up to the max
+    SCRAPE_BLOCK_TTL: int = int(os.getenv("SCRAPE_BLOCK_TTL", 900))
+    SCRAPE_BLOCK_MAX_TTL: int = int(os.getenv("SCRAPE_BLOCK_MAX_TTL", 21600))
+
+    # -----------------------------
+    # SUMMARY PRECOMPUTE (INGESTION)
+    # -----------------------------
+    SUMMARY_PRECOMPUTE: bool = os.getenv("SUMMARY_PRECOMPUTE", "true").lower() == "true"
+    # Max concurrent background scrape+summarize jobs
+    SUMMARY_PRECOMPUTE_CONCURRENCY: int = int(os.getenv("SUMMARY_PRECOMPUTE_CONCURRENCY", 4))
+
+    # Cross-instance summary lock; waiters poll the cache this long before computing themselves
+    SUMMARY_LOCK_TTL: int = int(os.getenv("SUMMARY_LOCK_TTL", 30))
+
+    # -----------------------------
+    # SUMMARIZER CORPUS IDF
+    # -----------------------------
+    # Corpus IDF is used once it has seen this many articles (per-article TF-IDF before)
+    IDF_MIN_DOCS: int = int(os.getenv("IDF_MIN_DOCS", 50))
+    # Snapshot shared with pool workers; rewritten every IDF_SNAPSHOT_EVERY new documents
+    IDF_SNAPSHOT_PATH: str = os.getenv("IDF_SNAPSHOT_PATH", "data/idf_snapshot.json")
+    IDF_SNAPSHOT_EVERY: int = int(os.getenv("IDF_SNAPSHOT_EVERY", 25))
+    # Upper bound on terms held in memory / in the snapshot (most frequent kept)
+    IDF_MAX_TERMS: int = int(os.getenv("IDF_MAX_TERMS", 200000))
+    # Terms still below MIN_DF are deleted after this long without being seen (seconds)
+    IDF_RARE_TERM_TTL: int = int(os.getenv("IDF_RARE_TERM_TTL", 30 * 24 * 3600))
+
+    # -----------------------------
+    # USER STATS
+    # -----------------------------
+    # Seconds between full rebuilds of user_stats from source collections; 0 disables
+    USER_STATS_RECONCILE_INTERVAL: int = int(os.getenv("USER_STATS_RECONCILE_INTERVAL", 6 * 3600))
 
     # -----------------------------
     # CACHE TTL (STRICT)
     # -----------------------------
     CACHE_TTL_NEWS: int = 60 * 15  # 15 minutes (DO NOT LOWER)
+    # Extracted publisher pages kept for conditional-GET revalidation
+    CACHE_TTL_PAGE: int = int(os.getenv("CACHE_TTL_PAGE", 60 * 60 * 24 * 7))
 
 settings = Settings()
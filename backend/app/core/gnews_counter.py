@@ -6,6 +6,7 @@ Tracks API calls for rate limiting (100 requests/day free tier)
 from datetime import datetime
 from typing import Dict
 from app.core.cache import get_from_cache, set_in_cache, delete_from_cache
+from app.core.config import settings
 
 class GNewsCounter:
     """
@@ -15,8 +16,8 @@ class GNewsCounter:
     """
     
     CACHE_KEY = "gnews:hits:today"
-    MAX_HITS_PER_DAY = 100
-    WARNING_THRESHOLD = 80  # Warn at 80% usage
+    MAX_HITS_PER_DAY = settings.GNEWS_DAILY_LIMIT
+    WARNING_THRESHOLD = int(MAX_HITS_PER_DAY * 0.8)  # Warn at 80% usage
     
     @staticmethod
     def get_today_key() -> str:
@@ -4,11 +4,23 @@ Indexes are critical for query performance at scale.
 """
 
 import logging
+from pymongo.errors import OperationFailure
+from app.core.config import settings
 from app.core.database import MongoDB
+from app.services.idf_model import MIN_DF
 
 logger = logging.getLogger(__name__)
 
 
+async def _drop_index_if_exists(collection, name: str):
+    """Drop an index replaced by a wider one; missing indexes are ignored."""
+    try:
+        await collection.drop_index(name)
+        logger.info(f"[OK] Dropped superseded index {collection.name}.{name}")
+    except OperationFailure:
+        pass
+
+
 async def create_indexes():
     """
     Create indexes for all collections.
@@ -28,22 +40,26 @@ async def create_indexes():
             name="idx_user_article_unique"
         )
         
-        # Index for fetching user's bookmarks (sorted by created_at)
+        # Index for fetching user's bookmarks (keyset pages sorted by created_at, _id)
         await db.bookmarks.create_index(
-            [("user_id", 1), ("created_at", -1)],
-            name="idx_user_created"
+            [("user_id", 1), ("created_at", -1), ("_id", -1)],
+            name="idx_user_created_id"
         )
+        # Superseded by idx_user_created_id (its prefix)
+        await _drop_index_if_exists(db.bookmarks, "idx_user_created")
         
         logger.info("[OK] Bookmarks indexes created")
         
         # --------------------------------------------------
         # COMMENTS COLLECTION
         # --------------------------------------------------
-        # Index for fetching article's comments (sorted by created_at)
+        # Index for fetching article's comments (keyset pages sorted by created_at, _id)
         await db.comments.create_index(
-            [("article_id", 1), ("created_at", -1)],
-            name="idx_article_created"
+            [("article_id", 1), ("created_at", -1), ("_id", -1)],
+            name="idx_article_created_id"
         )
+        # Superseded by idx_article_created_id (its prefix)
+        await _drop_index_if_exists(db.comments, "idx_article_created")
         
         # Compound index for user's comments (_id + user_id) for faster lookups
         await db.comments.create_index(
@@ -51,6 +67,12 @@ async def create_indexes():
             name="idx_id_user"
         )
         
+        # Index for counting a user's comments (user_stats reconciliation)
+        await db.comments.create_index(
+            [("user_id", 1), ("created_at", -1)],
+            name="idx_user_created"
+        )
+
         logger.info("[OK] Comments indexes created")
         
         # --------------------------------------------------
@@ -63,11 +85,13 @@ async def create_indexes():
             name="idx_user_article_unique"
         )
         
-        # Index for fetching user's read later items (sorted by created_at)
+        # Index for fetching user's read later items (keyset pages sorted by created_at, _id)
         await db.read_later.create_index(
-            [("user_id", 1), ("created_at", -1)],
-            name="idx_user_created"
+            [("user_id", 1), ("created_at", -1), ("_id", -1)],
+            name="idx_user_created_id"
         )
+        # Superseded by idx_user_created_id (its prefix)
+        await _drop_index_if_exists(db.read_later, "idx_user_created")
         
         logger.info("[OK] Read Later indexes created")
         
@@ -98,7 +122,64 @@ async def create_indexes():
         )
 
         logger.info("[OK] Summary logs indexes created")
-        
+
+        # --------------------------------------------------
+        # ARTICLES COLLECTION (ARCHIVE)
+        # --------------------------------------------------
+        # _id is the article id computed by GNewsService (unique by default)
+
+        # Index for category feeds served from the archive (newest first)
+        await db.articles.create_index(
+            [("categories", 1), ("last_seen", -1)],
+            name="idx_categories_last_seen"
+        )
+
+        # Index for resolving articles by their original URL
+        await db.articles.create_index(
+            [("url", 1)],
+            name="idx_url"
+        )
+
+        # Index for recency queries and archive housekeeping
+        await db.articles.create_index(
+            [("first_seen", -1)],
+            name="idx_first_seen"
+        )
+
+        logger.info("[OK] Articles indexes created")
+
+        # --------------------------------------------------
+        # SUMMARIES COLLECTION (DURABLE SUMMARY STORE)
+        # --------------------------------------------------
+        # _id is the content hash of the extracted article text
+
+        # Index for finding summaries of an article (admin/debugging, invalidation)
+        await db.summaries.create_index(
+            [("article_ids", 1)],
+            name="idx_article_ids"
+        )
+
+        logger.info("[OK] Summaries indexes created")
+
+        # --------------------------------------------------
+        # IDF TERMS COLLECTION (SUMMARIZER CORPUS IDF)
+        # --------------------------------------------------
+        # Index for loading the most frequent terms at startup
+        await db.idf_terms.create_index(
+            [("df", -1)],
+            name="idx_df"
+        )
+
+        # TTL index pruning rare terms (below MIN_DF) that stopped appearing
+        await db.idf_terms.create_index(
+            [("last_seen", 1)],
+            expireAfterSeconds=settings.IDF_RARE_TERM_TTL,
+            partialFilterExpression={"df": {"$lt": MIN_DF}},
+            name="idx_rare_last_seen_ttl"
+        )
+
+        logger.info("[OK] IDF terms indexes created")
+
         logger.info("[OK] All MongoDB indexes created successfully")
         
     except Exception as e:
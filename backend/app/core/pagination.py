@@ -0,0 +1,80 @@
+"""
+Keyset (cursor) pagination for newest-first lists.
+Pages are ordered by (created_at, _id) descending; the cursor is the sort
+key of the last item served, encoded as opaque URL-safe base64. Each page is
+an index range scan of `limit + 1` documents, however deep the client goes,
+unlike skip/limit which rescans everything before the page.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+SORT = [("created_at", -1), ("_id", -1)]
+
+
+def encode_cursor(created_at: datetime, _id: ObjectId) -> str:
+    raw = json.dumps({"t": created_at.isoformat(), "id": str(_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """Raises 400 for cursors we did not issue."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["t"]), ObjectId(data["id"])
+    except (ValueError, KeyError, TypeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def after_cursor(query: Dict[str, Any], cursor: Optional[str]) -> Dict[str, Any]:
+    """Restrict query to items strictly after the cursor in SORT order."""
+    if not cursor:
+        return query
+    created_at, _id = decode_cursor(cursor)
+    return {
+        **query,
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": _id}},
+        ],
+    }
+
+
+async def fetch_page(
+    collection,
+    query: Dict[str, Any],
+    projection: Dict[str, int],
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of raw documents (newest first) and the cursor for the next
+    page, or None when this is the last one. _id is returned as a string.
+    """
+    docs = await (
+        collection.find(after_cursor(query, cursor), projection=projection)
+        .sort(SORT)
+        .limit(limit + 1)
+        .to_list(length=limit + 1)
+    )
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        last = docs[-1]
+        if isinstance(last.get("created_at"), datetime):
+            next_cursor = encode_cursor(last["created_at"], last["_id"])
+
+    for doc in docs:
+        doc["_id"] = str(doc["_id"])
+    return docs, next_cursor
@@ -0,0 +1,86 @@
+"""
+Request coalescing primitives.
+- SingleFlight: concurrent callers with the same key share one in-flight call (per process)
+- acquire_lock / release_lock: Redis lock so only one instance does the work
+"""
+
+import asyncio
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.cache import get_redis
+
+# Delete the lock only if we still own it (it may have expired and been re-acquired)
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Returned when Redis is unavailable: proceed as if the lock was acquired
+LOCAL_LOCK_TOKEN = "local"
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into one execution.
+    Every caller awaits the same result (or exception). The shared call is
+    shielded, so one caller disconnecting does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+
+async def acquire_lock(key: str, ttl_seconds: int) -> Optional[str]:
+    """
+    Try to take a Redis lock. Returns an ownership token, or None if another
+    holder has it. Without Redis every caller "acquires" (best-effort).
+    """
+    token = uuid.uuid4().hex
+    try:
+        client = await get_redis()
+        if client is None:
+            return LOCAL_LOCK_TOKEN
+        acquired = await client.set(key, token, nx=True, ex=ttl_seconds)
+        return token if acquired else None
+    except Exception as e:
+        print(f"[REDIS LOCK ERROR] {key}: {e}")
+        return LOCAL_LOCK_TOKEN
+
+
+async def lock_held(key: str) -> bool:
+    """Whether anyone currently holds the lock (False without Redis)."""
+    try:
+        client = await get_redis()
+        if client is None:
+            return False
+        return bool(await client.exists(key))
+    except Exception as e:
+        print(f"[REDIS LOCK ERROR] {key}: {e}")
+        return False
+
+
+async def release_lock(key: str, token: str):
+    """Release a lock taken with acquire_lock (no-op if we no longer own it)."""
+    if token == LOCAL_LOCK_TOKEN:
+        return
+    try:
+        client = await get_redis()
+        if client is None:
+            return
+        await client.eval(_RELEASE_SCRIPT, 1, key, token)
+    except Exception as e:
+        print(f"[REDIS UNLOCK ERROR] {key}: {e}")
@@ -0,0 +1,101 @@
+"""
+Process pool for CPU-bound work.
+Keeps TF-IDF and similar work off the event loop and spreads it across cores.
+Jobs must be picklable top-level functions with picklable arguments.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = Lock()
+# Jobs submitted and not yet finished (queued + running), across all callers
+_pending = 0
+
+
+class WorkerQueueFull(Exception):
+    """Raised instead of queueing when CPU_QUEUE_LIMIT jobs are already pending."""
+
+
+def get_executor() -> Optional[ProcessPoolExecutor]:
+    """Lazily create the shared pool. Returns None when CPU_WORKERS <= 0."""
+    global _executor
+
+    if settings.CPU_WORKERS <= 0:
+        return None
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # spawn (not fork): the parent holds torch/Motor threads that must not be forked
+                _executor = ProcessPoolExecutor(
+                    max_workers=settings.CPU_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.info(f"[WORKERS] Process pool started | workers={settings.CPU_WORKERS}")
+    return _executor
+
+
+def _reset_executor(broken: ProcessPoolExecutor):
+    """Drop a broken pool so the next job starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_cpu_bound(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run fn(*args, **kwargs) in the process pool without blocking the loop.
+    Falls back to a thread when the pool is disabled or a worker crashed.
+    Raises WorkerQueueFull when the pool is saturated, so callers can take
+    their fallback path instead of piling up latency.
+    """
+    global _pending
+
+    if _pending >= settings.CPU_QUEUE_LIMIT:
+        raise WorkerQueueFull(f"{_pending} CPU jobs pending")
+
+    call = partial(fn, *args, **kwargs)
+    executor = get_executor()
+
+    _pending += 1
+    try:
+        if executor is None:
+            return await asyncio.to_thread(call)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, call)
+        except BrokenProcessPool:
+            logger.error("[WORKERS] Process pool broken; restarting and running job in a thread")
+            _reset_executor(executor)
+            return await asyncio.to_thread(call)
+    finally:
+        _pending -= 1
+
+
+def pending_jobs() -> int:
+    """Jobs currently queued or running in the pool."""
+    return _pending
+
+
+def shutdown_workers():
+    """Stop the pool. Called during application shutdown."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("[WORKERS] Process pool stopped")
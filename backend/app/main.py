@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -5,7 +6,12 @@ from app.core.database import MongoDB
 from app.core.logging import configure_logging
 from app.core.indexes import create_indexes
 from app.core.cache import get_redis, close_redis
+from app.core.workers import get_executor, shutdown_workers
 from app.services.sentiment_ml import SentimentService, _load_model
+from app.services.idf_model import IdfStore
+from app.services.summary_service import cancel_precompute
+from app.services.user_stats import run_reconciliation
+from app.services.article_id_migration import run_article_id_migration
 
 
 from app.routers import (
@@ -17,6 +23,7 @@ from app.routers import (
     read_laters,
     feedbacks,
     profile,
+    saved,
 )
 
 # --------------------------------------------------
@@ -68,6 +75,7 @@ app.include_router(bookmarks.router, prefix="/api/bookmarks", tags=["Bookmarks"]
 app.include_router(read_laters.router, prefix="/api/read-later", tags=["Read Later"])
 app.include_router(feedbacks.router, prefix="/api/feedback", tags=["Feedback"])
 app.include_router(profile.router, prefix="/api/profile", tags=["Profile"])
+app.include_router(saved.router, prefix="/api/saved", tags=["Saved"])
 
 logger = logging.getLogger(__name__)
 
@@ -88,10 +96,25 @@ async def startup_event():
         print("[SENTIMENT] ML model loaded successfully at startup")
     except Exception as exc:
         logger.warning("[SENTIMENT] Model preload failed; will use neutral fallback: %s", exc)
+    # ✅ Load corpus IDF once; summaries fall back to per-article TF-IDF without it
+    try:
+        await IdfStore.load()
+    except Exception as exc:
+        logger.warning("[IDF] Corpus model load failed; using per-article TF-IDF: %s", exc)
+    # ✅ Start CPU worker pool (summarization) before the first request needs it
+    get_executor()
+    # ✅ Periodically rebuild user_stats counters from source collections
+    app.state.user_stats_job = asyncio.create_task(run_reconciliation())
+    # ✅ Move saved items and comments stored under outdated article ids (runs once)
+    app.state.article_id_job = asyncio.create_task(run_article_id_migration())
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await cancel_precompute()
+    app.state.user_stats_job.cancel()
+    app.state.article_id_job.cancel()
     MongoDB.close()
+    shutdown_workers()
     # ✅ Close Redis connection on shutdown
     try:
         await close_redis()
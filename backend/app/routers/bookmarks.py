@@ -1,12 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pymongo.errors import DuplicateKeyError
 from app.core.database import get_db
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, fetch_page
 from app.models.bookmark import BookmarkModel
 from bson import ObjectId
 from app.core.auth import get_current_user_optional
+from app.services.saved_items import MAX_BULK_ITEMS, delete_items, export_items, insert_items
+from app.services.saved_state import SavedState
+from app.services.user_stats import UserStats
 
 
 router = APIRouter()
 
+# Fields the bookmarks list renders (skips anything else stored on the document)
+BOOKMARK_PROJECTION = {
+    "article_id": 1,
+    "title": 1,
+    "source": 1,
+    "category": 1,
+    "url": 1,
+    "image_url": 1,
+    "created_at": 1,
+}
+
 
 # --------------------------------------------------
 # ADD BOOKMARK
@@ -19,18 +37,16 @@ async def add_bookmark(
 ):
     user_id = user["user_id"]
 
-    existing = await db.bookmarks.find_one({
-        "user_id": user_id,
-        "article_id": bookmark.article_id
-    })
-
-    if existing:
-        raise HTTPException(status_code=400, detail="Already bookmarked")
-
     data = bookmark.dict()
     data["user_id"] = user_id
 
-    result = await db.bookmarks.insert_one(data)
+    # The unique (user_id, article_id) index rejects duplicates atomically
+    try:
+        result = await db.bookmarks.insert_one(data)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Already bookmarked")
+    await UserStats.record_saved(user_id, "bookmarks", data)
+    await SavedState.record_added(user_id, "bookmarks", [data["article_id"]])
 
     return {
         "message": "Bookmark added",
@@ -44,27 +60,75 @@ async def add_bookmark(
 # --------------------------------------------------
 @router.get("/")
 async def get_bookmarks(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     user=Depends(get_current_user_optional),
     db=Depends(get_db),
 ):
+    """Newest first, one page at a time; pass next_cursor back to continue."""
     user_id = user["user_id"]
 
-    bookmarks = []
-    cursor = db.bookmarks.find(
-        {"user_id": user_id}
-    ).sort("created_at", -1)
-
-    async for item in cursor:
-        item["_id"] = str(item["_id"])
-        bookmarks.append(BookmarkModel(**item))
+    bookmarks, next_cursor = await fetch_page(
+        db.bookmarks,
+        {"user_id": user_id},
+        BOOKMARK_PROJECTION,
+        limit,
+        cursor,
+    )
 
     return {
         "count": len(bookmarks),
-        "bookmarks": bookmarks
+        "bookmarks": bookmarks,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
     }
 
 
 
+# --------------------------------------------------
+# BULK SAVE / REMOVE / EXPORT
+# --------------------------------------------------
+@router.post("/bulk")
+async def bulk_add_bookmarks(
+    items: List[BookmarkModel],
+    user=Depends(get_current_user_optional),
+    db=Depends(get_db),
+):
+    """Save many items in one round trip; duplicates are reported, not fatal."""
+    if len(items) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ITEMS} items per request")
+
+    result = await insert_items(db.bookmarks, "bookmarks", user["user_id"], [i.dict() for i in items])
+    return {"message": "Bulk save complete", **result}
+
+
+@router.post("/bulk/delete")
+async def bulk_remove_bookmarks(
+    ids: List[str] = Body(..., embed=True),
+    user=Depends(get_current_user_optional),
+    db=Depends(get_db),
+):
+    """Remove many items by id; ids that don't exist (or aren't yours) are reported."""
+    if len(ids) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ITEMS} ids per request")
+
+    result = await delete_items(db.bookmarks, "bookmarks", user["user_id"], ids)
+    return {"message": "Bulk remove complete", **result}
+
+
+@router.get("/export")
+async def export_bookmarks(
+    user=Depends(get_current_user_optional),
+    db=Depends(get_db),
+):
+    """All items as NDJSON (one JSON object per line), streamed."""
+    return StreamingResponse(
+        export_items(db.bookmarks, user["user_id"], BOOKMARK_PROJECTION),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="bookmarks.ndjson"'},
+    )
+
+
 # --------------------------------------------------
 # REMOVE BOOKMARK
 # --------------------------------------------------
@@ -76,16 +140,20 @@ async def delete_bookmark(
 ):
     user_id = user["user_id"]
 
-    result = await db.bookmarks.delete_one({
+    # Deleted document tells us which stats buckets to decrement
+    deleted = await db.bookmarks.find_one_and_delete({
         "_id": ObjectId(bookmark_id),
         "user_id": user_id
     })
 
-    if result.deleted_count == 0:
+    if deleted is None:
         raise HTTPException(
             status_code=404,
             detail="Bookmark not found or not authorized"
         )
 
+    await UserStats.record_unsaved(user_id, "bookmarks", deleted)
+    await SavedState.record_removed(user_id, "bookmarks", [deleted.get("article_id")])
+
     return {"message": "Bookmark removed"}
 
@@ -1,14 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from bson import ObjectId
 from app.core.database import get_db
 from app.core.auth import get_current_user_optional
-from app.core.cache import get_from_cache, set_in_cache, delete_from_cache
-from app.models.comment import CommentModel, CommentCreateRequest
+from app.core.pagination import DEFAULT_PAGE_SIZE, SORT, encode_cursor, fetch_page
+from app.models.comment import CommentCreateRequest
+from app.services.comment_cache import HEAD_SIZE, CommentCache, serialize_comment
+from app.services.user_stats import UserStats
 
 router = APIRouter()
 
-# Cache configuration
-COMMENTS_CACHE_TTL = 300  # 5 minutes
+# Max article ids per batch count request
+MAX_COUNT_IDS = 200
+
+# Stored comment fields the API returns
+COMMENT_PROJECTION = {
+    "article_id": 1,
+    "article_title": 1,
+    "text": 1,
+    "user_id": 1,
+    "username": 1,
+    "created_at": 1,
+}
 
 
 @router.post("/")
@@ -22,67 +36,98 @@ async def add_comment(
     data["user_email"] = user.get("email")
     # Extract username from user email (part before @) or use user_id as fallback
     data["username"] = user.get("name") or user.get("email", "").split("@")[0] or user["user_id"]
+    # Millisecond precision: what Mongo stores, so cached and stored comments match
+    now = datetime.utcnow()
+    data["created_at"] = now.replace(microsecond=now.microsecond // 1000 * 1000)
 
     result = await db.comments.insert_one(data)
-    
-    # Invalidate cache for this article
-    cache_key = f"comments:{data['article_id']}"
-    await delete_from_cache(cache_key)
+    await UserStats.record_comment(data["user_id"])
+
+    # Write-through: prepend to the cached head page instead of invalidating it
+    created = serialize_comment(data)
+    await CommentCache.push(created)
 
     # Return the full comment object
-    from datetime import datetime
-    now = datetime.utcnow()
-    return {
-        "id": str(result.inserted_id),
-        "_id": str(result.inserted_id),
-        "article_id": data["article_id"],
-        "article_title": data["article_title"],
-        "text": data["text"],
-        "user_id": data["user_id"],
-        "username": data["username"],
-        "created_at": now.isoformat(),
-    }
+    return {**created, "_id": created["id"]}
+
+
+@router.post("/counts")
+async def get_comment_counts(
+    article_ids: List[str] = Body(..., embed=True),
+    db=Depends(get_db),
+):
+    """
+    Comment counts for a batch of articles (e.g. one feed page of cards).
+    Cached counts come from Redis; the rest from one aggregation on
+    idx_article_created.
+    """
+    if len(article_ids) > MAX_COUNT_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_COUNT_IDS} article ids per request")
+
+    ids = list(dict.fromkeys(a for a in article_ids if a))
+    counts, generations = await CommentCache.get_counts(ids)
+
+    missing = [article_id for article_id in ids if article_id not in counts]
+    if missing:
+        pipeline = [
+            {"$match": {"article_id": {"$in": missing}}},
+            {"$group": {"_id": "$article_id", "count": {"$sum": 1}}},
+        ]
+        aggregated = {article_id: 0 for article_id in missing}
+        async for row in db.comments.aggregate(pipeline):
+            aggregated[row["_id"]] = row["count"]
+        await CommentCache.fill_counts(aggregated, generations)
+        counts.update(aggregated)
+
+    return {"counts": {article_id: counts[article_id] for article_id in ids}}
 
 
 @router.get("/{article_id}")
-async def get_comments(article_id: str, db=Depends(get_db)):
-    cache_key = f"comments:{article_id}"
-    
-    # Try to get from cache first
-    cached_data = await get_from_cache(cache_key)
-    if cached_data:
-        return cached_data
-    
-    comments = []
-    cursor = db.comments.find(
-        {"article_id": article_id}
-    ).sort("created_at", -1)
-
-    async for comment in cursor:
-        # Convert ObjectId to string for Pydantic validation
-        comment["_id"] = str(comment["_id"])
-        comment_model = CommentModel(**comment)
-        # Convert to dict and ensure proper serialization
-        comment_dict = {
-            "id": comment_model.id or str(comment["_id"]),
-            "article_id": comment_model.article_id,
-            "article_title": comment_model.article_title,
-            "text": comment_model.text,
-            "user_id": comment_model.user_id,
-            "username": comment_model.username,
-            "created_at": comment_model.created_at.isoformat() if hasattr(comment_model.created_at, 'isoformat') else str(comment_model.created_at),
-        }
-        comments.append(comment_dict)
-
-    result = {
+async def get_comments(
+    article_id: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=HEAD_SIZE),
+    cursor: Optional[str] = None,
+    db=Depends(get_db),
+):
+    """Newest first, one page at a time; pass next_cursor back to continue."""
+    if cursor:
+        docs, next_cursor = await fetch_page(
+            db.comments, {"article_id": article_id}, COMMENT_PROJECTION, limit, cursor
+        )
+        comments = [serialize_comment(doc) for doc in docs]
+        return _page(comments, next_cursor)
+
+    # First page: served from the cached head when it has enough comments
+    comments, generation, has_more = await CommentCache.head_page(article_id, limit)
+    if comments is None:
+        newest = await (
+            db.comments.find({"article_id": article_id}, projection=COMMENT_PROJECTION)
+            .sort(SORT)
+            .limit(HEAD_SIZE + 1)
+            .to_list(length=HEAD_SIZE + 1)
+        )
+        newest = [serialize_comment(doc) for doc in newest]
+        await CommentCache.load_head(article_id, newest, generation)
+        comments, has_more = newest[:limit], len(newest) > limit
+
+    next_cursor = None
+    if has_more and comments:
+        last = comments[-1]
+        try:
+            next_cursor = encode_cursor(datetime.fromisoformat(last["created_at"]), ObjectId(last["id"]))
+        except (TypeError, ValueError):
+            # Legacy comment stored without created_at: can't page past it
+            next_cursor = None
+    return _page(comments, next_cursor)
+
+
+def _page(comments: List[Dict], next_cursor: Optional[str]) -> Dict:
+    return {
         "count": len(comments),
         "comments": comments,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
     }
-    
-    # Cache the result
-    await set_in_cache(cache_key, result, ttl=COMMENTS_CACHE_TTL)
-    
-    return result
 
 
 @router.delete("/{comment_id}")
@@ -91,15 +136,22 @@ async def delete_comment(
     user=Depends(get_current_user_optional),
     db=Depends(get_db),
 ):
-    result = await db.comments.delete_one({
-        "_id": ObjectId(comment_id),
-        "user_id": user["user_id"],
-    })
+    # Deleted document tells us which article's cached head to update
+    deleted = await db.comments.find_one_and_delete(
+        {
+            "_id": ObjectId(comment_id),
+            "user_id": user["user_id"],
+        },
+        projection={"article_id": 1},
+    )
 
-    if result.deleted_count == 0:
+    if deleted is None:
         raise HTTPException(
             status_code=404,
             detail="Comment not found or unauthorized",
         )
 
+    await CommentCache.remove(deleted["article_id"], comment_id)
+    await UserStats.record_comment(user["user_id"], -1)
+
     return {"message": "Comment deleted successfully"}
@@ -1,8 +1,15 @@
 ﻿import logging
-from fastapi import APIRouter, HTTPException
-from app.services.news_service import GNewsService
-from app.services.sentiment_ml import SentimentService  # ✅ Use new ML-based sentiment
-from app.core.cache import get_from_cache, set_in_cache, delete_from_cache
+from fastapi import APIRouter, HTTPException, Query
+from app.services.news_service import (
+    MAX_ARTICLES,
+    DEFAULT_COUNTRY,
+    DEFAULT_LANG,
+    feed_cache_key,
+    normalize_feed_params,
+)
+from app.services.article_store import ArticleStore
+from app.services.ingestion import archive_more_key, ingest_category
+from app.core.cache import get_from_cache, set_in_cache
 from app.core.gnews_counter import GNewsCounter
 
 router = APIRouter()
@@ -31,7 +38,7 @@ async def get_search_suggestions(q: str):
     seen_ids = set()
 
     for category in CATEGORIES:
-        cache_key = f"gnews:{category}"
+        cache_key = feed_cache_key(category)
         cached = await get_from_cache(cache_key)
         if not cached:
             continue
@@ -100,7 +107,7 @@ async def get_trending_headlines(max_items: int = 8):
     
     # Fallback: Use general news cache to avoid extra API hit
     logger.info("[CACHE MISS] trending headlines | checking general news cache...")
-    general_cache = await get_from_cache("gnews:general")
+    general_cache = await get_from_cache(feed_cache_key("general"))
     
     if general_cache:
         logger.info(f"[CACHE HIT] general news for trending | extracting {max_items} headlines")
@@ -130,13 +137,14 @@ async def get_trending_headlines(max_items: int = 8):
     # No cache available - fetch fresh general news (uses 1 API hit)
     logger.warning("[GNEWS HIT] trending headlines | no cache available, fetching fresh...")
     try:
-        articles = await GNewsService.fetch_category("general")
+        # Same ingestion as the feed endpoints: cache, archive, IDF and summary precompute
+        articles, _ = await ingest_category("general")
         logger.info(f"[GNEWS OK] trending headlines | fetched {len(articles)} articles")
     except Exception as e:
         logger.error(f"[GNEWS ERROR] trending headlines | {str(e)}")
         raise HTTPException(status_code=502, detail=str(e))
     
-    # Extract headlines (no sentiment needed for ticker - faster response)
+    # Extract headlines
     headlines = [
         {
             "id": article.get("id"),
@@ -153,10 +161,6 @@ async def get_trending_headlines(max_items: int = 8):
     await set_in_cache(cache_key, headlines, ttl=60 * 10)  # 10 min TTL
     logger.info(f"[CACHE SET] trending headlines | count={len(headlines)} | ttl=600s")
     
-    # Also cache full articles for general category (avoids double fetch)
-    await set_in_cache("gnews:general", articles)
-    logger.info(f"[CACHE SET] general news (from trending) | count={len(articles)}")
-    
     hit_status = await GNewsCounter.get_hit_status()
     
     return {
@@ -166,81 +170,140 @@ async def get_trending_headlines(max_items: int = 8):
         "hits": hit_status,
     }
 
-# --------------------------------------------------
-# HELPER: Add ML-based sentiment to articles
-# --------------------------------------------------
-async def add_sentiment_to_articles(articles):
+# -----------------------------
+# PAGINATION (SLICES OF THE CACHED FEED)
+# -----------------------------
+async def paginate_feed(articles, category, country, lang, page, page_size):
     """
-    Calculate sentiment for each article using ML model.
-    Combines title + description + content for analysis.
-    Includes Redis caching to avoid repeated ML inference.
+    Serve one page of a feed without any upstream call.
+    Pages inside the cached feed are slices of it; pages past its end are
+    filled from the archive (older stories of the same category/locale).
+    A page ending exactly at the end of the feed takes has_more from the
+    flag ingestion stores next to the feed instead of querying the archive.
     """
-    for article in articles:
-        # Use ML service to analyze article sentiment (checks Redis cache first)
-        sentiment_result = await SentimentService.analyze_article(
-            title=article.get('title', ''),
-            description=article.get('description', ''),
-            content=article.get('content', '')
-        )
-        
-        # Attach sentiment to article
-        article["sentiment"] = {
-            "label": sentiment_result["label"],
-            "confidence": sentiment_result["confidence"],
-            "model": sentiment_result["model"]
-        }
-    
-    return articles
+    offset = (page - 1) * page_size
+    total = len(articles)
+
+    items = articles[offset:offset + page_size] if offset < total else []
+    if offset + page_size < total:
+        return items, True
+    if offset + page_size == total:
+        flag = await get_from_cache(archive_more_key(feed_cache_key(category, country, lang)))
+        return items, bool(flag and flag.get("has_more"))
+
+    # Past the end of the cached feed: fill the page from the archive,
+    # reading one extra item to know whether another page exists
+    needed = page_size - len(items)
+    archived = await ArticleStore.recent_by_category(
+        category,
+        limit=needed + 1,
+        skip=max(0, offset - total),
+        country=country,
+        lang=lang,
+        exclude_ids=[article.get("id") for article in articles],
+    )
+    return items + archived[:needed], len(archived) > needed
+
 
 # -----------------------------
 # GET NEWS BY TOPIC (CACHE FIRST)
 # -----------------------------
 @router.get("/topic/{topic}")
-async def get_news_by_topic(topic: str):
+async def get_news_by_topic(
+    topic: str,
+    country: str = DEFAULT_COUNTRY,
+    lang: str = DEFAULT_LANG,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(MAX_ARTICLES, ge=1, le=50),
+):
     """Fetch news by topic/category with caching"""
-    # TODO: Future enhancement - include country/language/pagination in cache key
-    cache_key = f"gnews:{topic}"
+    category, country, lang = normalize_feed_params(topic, country, lang)
+    cache_key = feed_cache_key(category, country, lang)
 
     cached = await get_from_cache(cache_key)
     if cached:
-        logger.info(f"[CACHE HIT] {topic}")
+        logger.info(f"[CACHE HIT] {cache_key} | page={page}")
         # Cached articles ALREADY have sentiment - do NOT recompute
         # (Sentiment was added before caching, see API fetch branch below)
+        items, has_more = await paginate_feed(cached, category, country, lang, page, page_size)
         hit_status = await GNewsCounter.get_hit_status()
         return {
             "source": "cache",
-            "count": len(cached),
-            "articles": cached,
+            "count": len(items),
+            "articles": items,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
             "hits": hit_status,
         }
 
-    logger.info(f"[GNEWS HIT] {topic}")
+    logger.info(f"[GNEWS HIT] {cache_key}")
     try:
-        articles = await GNewsService.fetch_category(topic)
+        # Sentiment is added ONCE before caching (only for new/changed articles)
+        articles, _ = await ingest_category(category, country, lang)
     except Exception as e:
-        logger.error(f"Error fetching news for {topic}: {str(e)}")
+        logger.error(f"Error fetching news for {cache_key}: {str(e)}")
+        # Serve the last archived articles instead of failing outright
+        archived = await ArticleStore.recent_by_category(
+            category,
+            limit=page_size + 1,
+            skip=(page - 1) * page_size,
+            country=country,
+            lang=lang,
+        )
+        has_more = len(archived) > page_size
+        archived = archived[:page_size]
+        if archived:
+            logger.warning(f"[ARCHIVE FALLBACK] {cache_key} | count={len(archived)}")
+            hit_status = await GNewsCounter.get_hit_status()
+            return {
+                "source": "archive",
+                "count": len(archived),
+                "articles": archived,
+                "page": page,
+                "page_size": page_size,
+                "has_more": has_more,
+                "hits": hit_status,
+            }
         raise HTTPException(status_code=502, detail=str(e))
 
-    # Add sentiment ONCE before caching (includes per-article Redis caching)
-    articles = await add_sentiment_to_articles(articles)
-    
-    await set_in_cache(cache_key, articles)
-    
+    items, has_more = await paginate_feed(articles, category, country, lang, page, page_size)
+
     # ✅ Get hit status after API call
     hit_status = await GNewsCounter.get_hit_status()
 
     return {
         "source": "api",
-        "count": len(articles),
-        "articles": articles,
+        "count": len(items),
+        "articles": items,
+        "page": page,
+        "page_size": page_size,
+        "has_more": has_more,
         "hits": hit_status,  # ✅ Added
     }
 
+# -----------------------------
+# RESOLVE ARCHIVED ARTICLE
+# -----------------------------
+@router.get("/article/{article_id}")
+async def get_archived_article(article_id: str):
+    """Resolve a single article from the archive (no GNews hit)"""
+    article = await ArticleStore.get(article_id)
+    if not article:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return article
+
 # Backward compatibility
 @router.get("/{category}")
-async def get_news(category: str):
+async def get_news(
+    category: str,
+    country: str = DEFAULT_COUNTRY,
+    lang: str = DEFAULT_LANG,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(MAX_ARTICLES, ge=1, le=50),
+):
     """Fetch news by category (backward compatibility)"""
-    return await get_news_by_topic(category)
+    return await get_news_by_topic(category, country, lang, page, page_size)
 
 # ✅ NEW: Get hit counter status
 @router.get("/status/hits")
@@ -269,27 +332,25 @@ async def reset_hit_counter():
 # MANUAL REFRESH (1 HIT)
 # -----------------------------
 @router.post("/refresh/{category}")
-async def refresh_category(category: str):
+async def refresh_category(
+    category: str,
+    country: str = DEFAULT_COUNTRY,
+    lang: str = DEFAULT_LANG,
+):
     """Manually refresh news for a specific category"""
-    cache_key = f"gnews:{category}"
-    await delete_from_cache(cache_key)
-
-    logger.warning(f"[MANUAL REFRESH] {category}")
+    logger.warning(f"[MANUAL REFRESH] {category} ({country}/{lang})")
     try:
-        articles = await GNewsService.fetch_category(category)
+        # Previous feed stays cached until the fresh one replaces it (used for the diff)
+        articles, stats = await ingest_category(category, country, lang)
     except Exception as e:
         logger.error(f"Error refreshing {category}: {str(e)}")
         raise HTTPException(status_code=502, detail=str(e))
-    
-    # Add sentiment BEFORE caching (computed once, cached with articles)
-    articles = await add_sentiment_to_articles(articles)
-    
-    await set_in_cache(cache_key, articles)
 
     return {
         "message": f"{category} refreshed",
         "hits_used": 1,
         "articles": len(articles),
+        "delta": stats,
     }
 
 
@@ -302,14 +363,12 @@ async def refresh_all():
     categories = CATEGORIES
     total_articles = 0
     errors = []
+    deltas = {}
 
     for cat in categories:
         try:
-            await delete_from_cache(f"gnews:{cat}")
-            articles = await GNewsService.fetch_category(cat)
-            # Add sentiment BEFORE caching (computed once, cached with articles)
-            articles = await add_sentiment_to_articles(articles)
-            await set_in_cache(f"gnews:{cat}", articles)
+            articles, stats = await ingest_category(cat)
+            deltas[cat] = stats
             total_articles += len(articles)
         except Exception as e:
             logger.error(f"Error refreshing {cat}: {str(e)}")
@@ -321,5 +380,6 @@ async def refresh_all():
         "message": "All categories refreshed",
         "categories_refreshed": len(categories),
         "total_articles": total_articles,
+        "delta": deltas,
         "errors": errors if errors else None,
     }
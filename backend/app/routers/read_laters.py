@@ -1,11 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pymongo.errors import DuplicateKeyError
 from bson import ObjectId
 from app.core.database import get_db
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, fetch_page
 from app.core.auth import get_current_user_optional
 from app.models.read_later import ReadLaterModel
+from app.services.saved_items import MAX_BULK_ITEMS, delete_items, export_items, insert_items
+from app.services.saved_state import SavedState
+from app.services.user_stats import UserStats
 
 router = APIRouter()
 
+# Fields the read-later list renders (skips anything else stored on the document)
+READ_LATER_PROJECTION = {
+    "article_id": 1,
+    "title": 1,
+    "source": 1,
+    "category": 1,
+    "url": 1,
+    "image_url": 1,
+    "created_at": 1,
+}
+
 
 @router.post("/")
 async def add_read_later(
@@ -15,18 +33,16 @@ async def add_read_later(
 ):
     user_id = user["user_id"]
 
-    exists = await db.read_later.find_one({
-        "user_id": user_id,
-        "article_id": item.article_id,
-    })
-
-    if exists:
-        raise HTTPException(status_code=400, detail="Already in Read Later")
-
     data = item.dict()
     data["user_id"] = user_id
 
-    result = await db.read_later.insert_one(data)
+    # The unique (user_id, article_id) index rejects duplicates atomically
+    try:
+        result = await db.read_later.insert_one(data)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Already in Read Later")
+    await UserStats.record_saved(user_id, "read_later", data)
+    await SavedState.record_added(user_id, "read_later", [data["article_id"]])
 
     return {
         "message": "Added to Read Later",
@@ -36,26 +52,71 @@ async def add_read_later(
 
 @router.get("/")
 async def get_read_later(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     user=Depends(get_current_user_optional),
     db=Depends(get_db),
 ):
+    """Newest first, one page at a time; pass next_cursor back to continue."""
     user_id = user["user_id"]
 
-    items = []
-    cursor = db.read_later.find(
-        {"user_id": user_id}
-    ).sort("created_at", -1)
-
-    async for item in cursor:
-        item["_id"] = str(item["_id"])
-        items.append(ReadLaterModel(**item))
+    items, next_cursor = await fetch_page(
+        db.read_later,
+        {"user_id": user_id},
+        READ_LATER_PROJECTION,
+        limit,
+        cursor,
+    )
 
     return {
         "count": len(items),
         "items": items,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
     }
 
 
+@router.post("/bulk")
+async def bulk_add_read_later(
+    items: List[ReadLaterModel],
+    user=Depends(get_current_user_optional),
+    db=Depends(get_db),
+):
+    """Save many items in one round trip; duplicates are reported, not fatal."""
+    if len(items) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ITEMS} items per request")
+
+    result = await insert_items(db.read_later, "read_later", user["user_id"], [i.dict() for i in items])
+    return {"message": "Bulk save complete", **result}
+
+
+@router.post("/bulk/delete")
+async def bulk_remove_read_later(
+    ids: List[str] = Body(..., embed=True),
+    user=Depends(get_current_user_optional),
+    db=Depends(get_db),
+):
+    """Remove many items by id; ids that don't exist (or aren't yours) are reported."""
+    if len(ids) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ITEMS} ids per request")
+
+    result = await delete_items(db.read_later, "read_later", user["user_id"], ids)
+    return {"message": "Bulk remove complete", **result}
+
+
+@router.get("/export")
+async def export_read_later(
+    user=Depends(get_current_user_optional),
+    db=Depends(get_db),
+):
+    """All items as NDJSON (one JSON object per line), streamed."""
+    return StreamingResponse(
+        export_items(db.read_later, user["user_id"], READ_LATER_PROJECTION),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="read_later.ndjson"'},
+    )
+
+
 @router.delete("/{item_id}")
 async def remove_read_later(
     item_id: str,
@@ -64,15 +125,19 @@ async def remove_read_later(
 ):
     user_id = user["user_id"]
 
-    result = await db.read_later.delete_one({
+    # Deleted document tells us which stats buckets to decrement
+    deleted = await db.read_later.find_one_and_delete({
         "_id": ObjectId(item_id),
         "user_id": user_id,
     })
 
-    if result.deleted_count == 0:
+    if deleted is None:
         raise HTTPException(
             status_code=404,
             detail="Item not found or unauthorized",
         )
 
+    await UserStats.record_unsaved(user_id, "read_later", deleted)
+    await SavedState.record_removed(user_id, "read_later", [deleted.get("article_id")])
+
     return {"message": "Removed from Read Later"}
@@ -0,0 +1,31 @@
+from typing import List
+from fastapi import APIRouter, Body, Depends, HTTPException
+from app.core.database import get_db
+from app.core.auth import get_current_user_optional
+from app.services.saved_state import SavedState
+
+router = APIRouter()
+
+# A feed page is ~20 cards; leave room for infinite scroll prefetching
+MAX_LOOKUP_IDS = 200
+
+
+@router.post("/state")
+async def get_saved_state(
+    article_ids: List[str] = Body(..., embed=True),
+    user=Depends(get_current_user_optional),
+    db=Depends(get_db),
+):
+    """
+    Bookmark / read-later flags for a batch of article ids, e.g. the cards
+    of one feed page. Answered from the user's Redis sets when loaded,
+    otherwise with one $in query per collection.
+    """
+    if len(article_ids) > MAX_LOOKUP_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_LOOKUP_IDS} article ids per request")
+
+    states = await SavedState.lookup(db, user["user_id"], article_ids)
+    return {
+        "count": len(states),
+        "states": states,
+    }
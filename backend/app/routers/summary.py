@@ -1,14 +1,14 @@
-import hashlib
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends
-from app.core.cache import get_from_cache, set_in_cache
-from app.services.summarizer import TextSummarizer
-from app.services.text_utils import extract_article_text
+from fastapi import APIRouter, HTTPException, Depends, Query
+from app.services.summary_service import get_or_build_summary
 from app.core.auth import get_current_user_optional
 from app.core.database import get_db
+from app.core.workers import pending_jobs
+from app.services.domain_health import DomainHealth
+from app.services.user_stats import UserStats
+from app.services.text_utils import ExtractionTimings
 
 router = APIRouter()
-summarizer = TextSummarizer()
 
 
 @router.post("/")
@@ -31,85 +31,41 @@ async def generate_summary(
     if not article_url:
         raise HTTPException(status_code=400, detail="Article URL is required")
 
-    cache_key = "summary:" + hashlib.md5(article_url.encode()).hexdigest()
-
-    cached = await get_from_cache(cache_key)
-    if cached:
-        try:
-            await db.summary_logs.insert_one({
-                "user_id": user["user_id"],
-                "url": article_url,
-                "source": "cache",
-                "created_at": datetime.utcnow(),
-            })
-        except Exception:
-            pass
-        return cached
-
-    article_text = None
-    summary = None
-    source = "generated"
-
-    # --------------------------------------------------
-    # 1️⃣ Prefer full article text (scrape)
-    # --------------------------------------------------
-    try:
-        article_text = await extract_article_text(article_url)
-    except Exception:
-        article_text = None
-
-    # --------------------------------------------------
-    # 2️⃣ Fallback to GNews content
-    # --------------------------------------------------
-    if not article_text and gnews_content:
-        article_text = gnews_content
-
-    # --------------------------------------------------
-    # 3️⃣ NLP summary ONLY if enough text
-    # --------------------------------------------------
-    if article_text and len(article_text.split()) >= 200:
-        try:
-            summary = summarizer.summarize(
-                article_text,
-                min_words=100,
-                max_words=120
-            )
-        except Exception:
-            summary = None
-
-    # --------------------------------------------------
-    # 4️⃣ PAYWALL / FAILURE → USE DESCRIPTION
-    # --------------------------------------------------
-    if not summary and gnews_description:
-        summary = gnews_description.strip()
-        source = "description"
-
-    # --------------------------------------------------
-    # 5️⃣ LAST RESORT
-    # --------------------------------------------------
-    if not summary:
-        summary = (
-            "This article could not be summarized due to publisher restrictions. "
-            "Please open the full article to read more."
-        )
-        source = "placeholder"
-
-    response = {
-        "summary": summary,
-        "source": source,
-        "is_fallback": source != "generated",
-    }
+    # Concurrent requests for the same article share one scrape-and-summarize
+    response, was_cached = await get_or_build_summary(article_url, gnews_content, gnews_description)
 
     try:
         await db.summary_logs.insert_one({
             "user_id": user["user_id"],
             "url": article_url,
-            "source": source,
+            "source": "cache" if was_cached else response["source"],
             "created_at": datetime.utcnow(),
         })
     except Exception:
         pass
-
-    await set_in_cache(cache_key, response)
+    else:
+        await UserStats.record_summary_read(user["user_id"])
 
     return response
+
+
+@router.get("/admin/scrape-timings")
+async def get_scrape_timings():
+    """Fetch, worker queue and parse latency for article scraping (ADMIN ONLY - diagnostics)"""
+    return {
+        "status": "ok",
+        "timings": ExtractionTimings.snapshot(),
+        "cpu_jobs_pending": pending_jobs(),
+    }
+
+
+@router.get("/admin/domains")
+async def get_domain_health(limit: int = Query(100, ge=1, le=1000)):
+    """Per-publisher scrape health, worst first (ADMIN ONLY - diagnostics)"""
+    domains = await DomainHealth.get_stats(limit)
+    return {
+        "status": "ok",
+        "count": len(domains),
+        "blocked": sum(1 for d in domains if d["blocked_for"] > 0),
+        "domains": domains,
+    }
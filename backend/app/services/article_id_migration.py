@@ -0,0 +1,134 @@
+"""
+One-off rewrite of stored article ids after a change to how they are derived
+(url_utils.article_id_for): md5 of the raw URL originally, then of the
+canonical URL, then with a narrower list of stripped query params.
+
+Bookmarks and read-later items keep their URL, so their id is recomputed
+from it; an item colliding with the user's save of the same story under the
+new id is a duplicate and is removed. Comments only store the id, so they are
+mapped through the saved items and the article archive (whose documents keep
+their URL under the id they were archived with).
+
+Completion is recorded in `migrations` under MIGRATION_ID; bump
+ARTICLE_ID_VERSION whenever canonicalization changes ids again.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict
+
+from pymongo.errors import DuplicateKeyError
+
+from app.core.database import MongoDB
+from app.services.comment_cache import CommentCache
+from app.services.saved_state import SavedState
+from app.services.url_utils import article_id_for
+from app.services.user_stats import UserStats
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_ID_VERSION = 2
+MIGRATION_ID = f"article_ids_v{ARTICLE_ID_VERSION}"
+
+SAVED_KINDS = ("bookmarks", "read_later")
+
+# Archive ids resolved per query when mapping comment article ids
+LOOKUP_BATCH_SIZE = 500
+
+
+async def _migrate_saved(db, kind: str, id_map: Dict[str, str]) -> int:
+    """Recompute article_id from url for one saved-items collection. Returns items moved."""
+    collection = db[kind]
+    moved = 0
+    users = set()
+
+    cursor = collection.find(
+        {"url": {"$type": "string"}},
+        projection={"article_id": 1, "url": 1, "user_id": 1, "category": 1, "sentiment": 1, "created_at": 1},
+    )
+    async for doc in cursor:
+        old_id = doc.get("article_id")
+        new_id = article_id_for(doc["url"])
+        if old_id == new_id:
+            continue
+        if old_id:
+            id_map[old_id] = new_id
+        users.add(doc["user_id"])
+
+        try:
+            await collection.update_one({"_id": doc["_id"]}, {"$set": {"article_id": new_id}})
+            moved += 1
+        except DuplicateKeyError:
+            # The user also saved the story under its new id. Only the run
+            # that actually deleted it adjusts the stats (runs may overlap).
+            result = await collection.delete_one({"_id": doc["_id"]})
+            if result.deleted_count == 1:
+                await UserStats.record_unsaved(doc["user_id"], kind, doc)
+
+    for user_id in users:
+        await SavedState.forget(user_id, kind)
+    return moved
+
+
+async def _migrate_comments(db, id_map: Dict[str, str]) -> int:
+    """Move comments to their article's new id. Returns comments moved."""
+    # $group streams through a cursor; distinct returns one document capped at 16 MB
+    cursor = db.comments.aggregate([
+        {"$match": {"article_id": {"$type": "string"}}},
+        {"$group": {"_id": "$article_id"}},
+    ])
+    article_ids = [row["_id"] async for row in cursor if row["_id"]]
+
+    # Archive documents stored under an outdated id still carry the URL
+    unknown = [article_id for article_id in article_ids if article_id not in id_map]
+    for start in range(0, len(unknown), LOOKUP_BATCH_SIZE):
+        batch = unknown[start:start + LOOKUP_BATCH_SIZE]
+        async for doc in db.articles.find({"_id": {"$in": batch}, "url": {"$type": "string"}}, projection={"url": 1}):
+            new_id = article_id_for(doc["url"])
+            if new_id != doc["_id"]:
+                id_map[doc["_id"]] = new_id
+
+    moved = 0
+    for old_id in article_ids:
+        new_id = id_map.get(old_id)
+        if not new_id or new_id == old_id:
+            continue
+        result = await db.comments.update_many({"article_id": old_id}, {"$set": {"article_id": new_id}})
+        moved += result.modified_count
+        await CommentCache.forget(old_id)
+        await CommentCache.forget(new_id)
+    return moved
+
+
+async def migrate_article_ids() -> bool:
+    """
+    Rewrite outdated article ids unless this version already ran.
+    Idempotent, so concurrent runs from several instances are harmless.
+    Returns True if it ran.
+    """
+    db = MongoDB.get_database()
+    if await db.migrations.find_one({"_id": MIGRATION_ID}):
+        return False
+
+    logger.info(f"[MIGRATION] {MIGRATION_ID} started")
+    id_map: Dict[str, str] = {}
+    moved = {}
+    for kind in SAVED_KINDS:
+        moved[kind] = await _migrate_saved(db, kind, id_map)
+    moved["comments"] = await _migrate_comments(db, id_map)
+
+    await db.migrations.update_one(
+        {"_id": MIGRATION_ID},
+        {"$set": {"completed_at": datetime.utcnow(), "moved": moved}},
+        upsert=True,
+    )
+    logger.info(f"[MIGRATION] {MIGRATION_ID} done | moved={moved}")
+    return True
+
+
+async def run_article_id_migration():
+    """Background startup job: never blocks or fails startup."""
+    try:
+        await migrate_article_ids()
+    except Exception as e:
+        logger.error(f"[MIGRATION] {MIGRATION_ID} failed (retried on next startup): {e}")
@@ -0,0 +1,195 @@
+"""
+Persistent article archive.
+Every article fetched from GNews is upserted into the `articles` collection,
+keyed by the same `id` GNewsService computes, so nothing we paid an API hit
+for disappears when the Redis feed cache expires.
+
+An article can appear in several locale feeds, so membership accumulates in
+`locales` ("<country>:<lang>") alongside `categories`. Documents archived
+before `locales` existed are matched on their country/lang fields instead,
+with a missing field read as the default locale.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from pymongo import UpdateOne
+
+from app.core.database import MongoDB
+from app.services.news_service import DEFAULT_COUNTRY, DEFAULT_LANG
+
+logger = logging.getLogger(__name__)
+
+# Fields copied verbatim from the GNews article dict onto the archive document
+ARCHIVED_FIELDS = (
+    "title",
+    "description",
+    "content",
+    "image_url",
+    "source",
+    "url",
+    "canonical_url",
+    "published_at",
+    "country",
+    "lang",
+)
+
+
+def _locale(country: str, lang: str) -> str:
+    return f"{country}:{lang}"
+
+
+def _locale_filter(country: str, lang: str) -> Dict:
+    """Match articles seen in this locale, including pre-`locales` documents."""
+    def legacy(field: str, value: str, default: str):
+        return {field: {"$in": [value, None]}} if value == default else {field: value}
+
+    return {"$or": [
+        {"locales": _locale(country, lang)},
+        {
+            "locales": {"$exists": False},
+            **legacy("country", country, DEFAULT_COUNTRY),
+            **legacy("lang", lang, DEFAULT_LANG),
+        },
+    ]}
+
+
+def _to_article(doc: Dict) -> Dict:
+    """Convert an archive document back to the article shape the API serves."""
+    article = {"id": doc["_id"]}
+    for field in ARCHIVED_FIELDS:
+        article[field] = doc.get(field)
+    categories = doc.get("categories") or []
+    article["category"] = doc.get("category") or (categories[0] if categories else None)
+    if doc.get("sentiment"):
+        article["sentiment"] = doc["sentiment"]
+    return article
+
+
+class ArticleStore:
+    """
+    MongoDB-backed archive of ingested articles.
+    All methods are best-effort: archive failures are logged and never
+    break the feed path that called them.
+    """
+
+    COLLECTION = "articles"
+
+    @staticmethod
+    def _collection():
+        return MongoDB.get_database()[ArticleStore.COLLECTION]
+
+    @staticmethod
+    async def upsert_articles(articles: List[Dict], category: str) -> int:
+        """
+        Bulk-upsert fetched articles in a single round trip.
+        - first_seen is only written on insert
+        - last_seen is bumped on every fetch
+        - category and locale membership accumulate across fetches
+        - sentiment is only overwritten when the caller computed one
+        Returns the number of documents inserted or modified.
+        """
+        if not articles:
+            return 0
+
+        now = datetime.utcnow()
+        operations = []
+
+        for article in articles:
+            article_id = article.get("id")
+            if not article_id:
+                continue
+
+            fields = {field: article.get(field) for field in ARCHIVED_FIELDS}
+            fields["category"] = article.get("category") or category
+            fields["last_seen"] = now
+            if article.get("sentiment"):
+                fields["sentiment"] = article["sentiment"]
+
+            operations.append(
+                UpdateOne(
+                    {"_id": article_id},
+                    {
+                        "$set": fields,
+                        "$setOnInsert": {"first_seen": now},
+                        "$addToSet": {
+                            "categories": category,
+                            "locales": _locale(
+                                article.get("country") or DEFAULT_COUNTRY,
+                                article.get("lang") or DEFAULT_LANG,
+                            ),
+                        },
+                    },
+                    upsert=True,
+                )
+            )
+
+        if not operations:
+            return 0
+
+        try:
+            result = await ArticleStore._collection().bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.error(f"[ARCHIVE ERROR] upsert {category}: {e}")
+            return 0
+
+        changed = result.upserted_count + result.modified_count
+        logger.info(
+            f"[ARCHIVE] {category} | upserted={result.upserted_count} | modified={result.modified_count}"
+        )
+        return changed
+
+    @staticmethod
+    async def get_many(article_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Resolve archived articles by id. Returns {id: article}."""
+        ids = [article_id for article_id in set(article_ids) if article_id]
+        if not ids:
+            return {}
+
+        try:
+            cursor = ArticleStore._collection().find({"_id": {"$in": ids}})
+            return {doc["_id"]: _to_article(doc) async for doc in cursor}
+        except Exception as e:
+            logger.error(f"[ARCHIVE ERROR] get_many: {e}")
+            return {}
+
+    @staticmethod
+    async def get(article_id: str) -> Optional[Dict]:
+        """Resolve a single archived article by id."""
+        found = await ArticleStore.get_many([article_id])
+        return found.get(article_id)
+
+    @staticmethod
+    async def recent_by_category(
+        category: str,
+        limit: int = 20,
+        *,
+        skip: int = 0,
+        country: Optional[str] = None,
+        lang: Optional[str] = None,
+        exclude_ids: Optional[Iterable[str]] = None,
+    ) -> List[Dict]:
+        """
+        Most recently seen archived articles for a category.
+        Optionally restricted to a locale and excluding ids the caller
+        already has (e.g. the cached feed when paging past its end).
+        """
+        query: Dict = {"categories": category}
+        if country or lang:
+            query.update(_locale_filter(country or DEFAULT_COUNTRY, lang or DEFAULT_LANG))
+        if exclude_ids:
+            query["_id"] = {"$nin": list(exclude_ids)}
+
+        try:
+            cursor = (
+                ArticleStore._collection()
+                .find(query)
+                .sort("last_seen", -1)
+                .skip(skip)
+                .limit(limit)
+            )
+            return [_to_article(doc) async for doc in cursor]
+        except Exception as e:
+            logger.error(f"[ARCHIVE ERROR] recent_by_category {category}: {e}")
+            return []
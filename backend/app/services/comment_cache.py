@@ -0,0 +1,263 @@
+"""
+Write-through cache of each article's newest comments.
+comments:head:<article_id> is a Redis list of serialized comments, newest
+first, capped at HEAD_SIZE + 1. New comments are pushed onto it (only if it is
+already cached) and deletes are removed from it, so it never needs a full
+invalidation. A sentinel at the tail means "no older comments exist"; once
+pushes trim the list past HEAD_SIZE the sentinel falls off with them.
+
+comments:count:<article_id> holds the article's comment count for feed
+cards, each key with its own TTL. Writes adjust a count only if its key
+exists; unknown counts are aggregated from Mongo and filled in by the reader.
+
+Writes also bump a per-article generation; a reload of the head or a count
+fill from Mongo is only published if no write happened while it was reading.
+"""
+
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.core.cache import get_redis
+
+HEAD_SIZE = 50
+HEAD_TTL = 3600
+
+SENTINEL = "__end__"
+
+# A count expires a day after it was last filled or changed, then is rebuilt lazily
+COUNT_TTL = 24 * 3600
+
+# KEYS: list, generation, count; ARGV: ttl, max list length, comment json, count ttl
+_PUSH_SCRIPT = """
+redis.call('incr', KEYS[2])
+redis.call('expire', KEYS[2], ARGV[1])
+if redis.call('exists', KEYS[3]) == 1 then
+    redis.call('incrby', KEYS[3], 1)
+    redis.call('expire', KEYS[3], ARGV[4])
+end
+if redis.call('lpushx', KEYS[1], ARGV[3]) > 0 then
+    redis.call('ltrim', KEYS[1], 0, tonumber(ARGV[2]) - 1)
+end
+return 1
+"""
+
+# KEYS: list, generation, count; ARGV: ttl, comment id, count ttl
+_REMOVE_SCRIPT = """
+redis.call('incr', KEYS[2])
+redis.call('expire', KEYS[2], ARGV[1])
+if redis.call('exists', KEYS[3]) == 1 then
+    redis.call('incrby', KEYS[3], -1)
+    redis.call('expire', KEYS[3], ARGV[3])
+end
+for _, item in ipairs(redis.call('lrange', KEYS[1], 0, -1)) do
+    if item ~= '__end__' and cjson.decode(item)['id'] == ARGV[2] then
+        return redis.call('lrem', KEYS[1], 1, item)
+    end
+end
+return 0
+"""
+
+# KEYS: list, generation; ARGV: expected generation, ttl, items...
+_LOAD_SCRIPT = """
+if (redis.call('get', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('del', KEYS[1])
+for i = 3, #ARGV do
+    redis.call('rpush', KEYS[1], ARGV[i])
+end
+redis.call('expire', KEYS[1], ARGV[2])
+return 1
+"""
+
+# KEYS: (count, generation) per article; ARGV: ttl, then (expected generation, count) per article
+_FILL_COUNTS_SCRIPT = """
+for i = 1, #KEYS, 2 do
+    local base = i + 1
+    if (redis.call('get', KEYS[i + 1]) or '0') == ARGV[base] then
+        redis.call('set', KEYS[i], ARGV[base + 1], 'EX', ARGV[1])
+    end
+end
+return 1
+"""
+
+
+def _head_key(article_id: str) -> str:
+    return f"comments:head:{article_id}"
+
+
+def _gen_key(article_id: str) -> str:
+    return f"comments:head:{article_id}:gen"
+
+
+def _count_key(article_id: str) -> str:
+    return f"comments:count:{article_id}"
+
+
+def serialize_comment(doc: Dict) -> Dict:
+    """API shape of a stored comment (no per-document model construction)."""
+    created_at = doc.get("created_at")
+    return {
+        "id": str(doc["_id"]),
+        "article_id": doc.get("article_id"),
+        "article_title": doc.get("article_title"),
+        "text": doc.get("text"),
+        "user_id": doc.get("user_id"),
+        "username": doc.get("username"),
+        "created_at": created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+    }
+
+
+class CommentCache:
+    """Best-effort: any Redis failure reads as a cache miss."""
+
+    @staticmethod
+    async def head_page(article_id: str, limit: int) -> Tuple[Optional[List[Dict]], Optional[str], bool]:
+        """
+        Newest `limit` comments from the cached head:
+        (comments, generation, has_more). comments is None on a miss; the
+        generation is then passed to load_head.
+        """
+        try:
+            client = await get_redis()
+            if client is None:
+                return None, None, False
+
+            pipe = client.pipeline(transaction=False)
+            pipe.lrange(_head_key(article_id), 0, limit)
+            pipe.get(_gen_key(article_id))
+            items, generation = await pipe.execute()
+        except Exception as e:
+            print(f"[REDIS GET ERROR] comments head {article_id}: {e}")
+            return None, None, False
+
+        generation = generation or "0"
+        if SENTINEL in items:
+            # Everything the article has is in the list
+            comments = [json.loads(item) for item in items[: items.index(SENTINEL)]]
+            return comments, generation, False
+        if len(items) > limit:
+            # A full page plus proof of at least one more
+            return [json.loads(item) for item in items[:limit]], generation, True
+        # Missing, or trimmed/deleted down below one page
+        return None, generation, False
+
+    @staticmethod
+    async def load_head(article_id: str, newest: List[Dict], generation: Optional[str]):
+        """
+        Publish the newest comments (serialized, up to HEAD_SIZE + 1 fetched)
+        as the cached head, unless a write happened since `generation` was read.
+        """
+        if generation is None:
+            return
+        # Keep the HEAD_SIZE + 1st comment, as push does, so a full page of
+        # HEAD_SIZE can still prove there are older comments
+        items = [json.dumps(comment) for comment in newest[: HEAD_SIZE + 1]]
+        if len(newest) <= HEAD_SIZE:
+            items.append(SENTINEL)
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            await client.eval(
+                _LOAD_SCRIPT, 2, _head_key(article_id), _gen_key(article_id),
+                generation, HEAD_TTL, *items,
+            )
+        except Exception as e:
+            print(f"[REDIS SET ERROR] comments head {article_id}: {e}")
+
+    @staticmethod
+    async def push(comment: Dict):
+        """A comment was inserted: prepend it to the cached head and count (if cached)."""
+        article_id = comment["article_id"]
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            await client.eval(
+                _PUSH_SCRIPT, 3, _head_key(article_id), _gen_key(article_id), _count_key(article_id),
+                HEAD_TTL, HEAD_SIZE + 1, json.dumps(comment), COUNT_TTL,
+            )
+        except Exception as e:
+            print(f"[REDIS SET ERROR] comments head {article_id}: {e}")
+
+    @staticmethod
+    async def remove(article_id: str, comment_id: str):
+        """A comment was deleted: drop it from the cached head and count."""
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            await client.eval(
+                _REMOVE_SCRIPT, 3, _head_key(article_id), _gen_key(article_id), _count_key(article_id),
+                HEAD_TTL, comment_id, COUNT_TTL,
+            )
+        except Exception as e:
+            print(f"[REDIS DELETE ERROR] comments head {article_id}: {e}")
+
+    @staticmethod
+    async def forget(article_id: str):
+        """Drop the article's cached head and count after its comments were moved in bulk."""
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            pipe = client.pipeline(transaction=False)
+            pipe.incr(_gen_key(article_id))
+            pipe.expire(_gen_key(article_id), HEAD_TTL)
+            pipe.delete(_head_key(article_id), _count_key(article_id))
+            await pipe.execute()
+        except Exception as e:
+            print(f"[REDIS DELETE ERROR] comments head {article_id}: {e}")
+
+    @staticmethod
+    async def get_counts(article_ids: List[str]) -> Tuple[Dict[str, int], Dict[str, str]]:
+        """
+        Cached comment counts: (counts for known articles, generation for
+        each unknown article, to pass to fill_counts).
+        """
+        if not article_ids:
+            return {}, {}
+        try:
+            client = await get_redis()
+            if client is None:
+                return {}, {}
+
+            pipe = client.pipeline(transaction=False)
+            pipe.mget([_count_key(article_id) for article_id in article_ids])
+            pipe.mget([_gen_key(article_id) for article_id in article_ids])
+            counts, generations = await pipe.execute()
+        except Exception as e:
+            print(f"[REDIS GET ERROR] comment counts: {e}")
+            return {}, {}
+
+        known = {}
+        unknown = {}
+        for article_id, count, generation in zip(article_ids, counts, generations):
+            if count is None:
+                unknown[article_id] = generation or "0"
+            else:
+                known[article_id] = max(int(count), 0)
+        return known, unknown
+
+    @staticmethod
+    async def fill_counts(counts: Dict[str, int], generations: Dict[str, str]):
+        """Store counts aggregated from Mongo, skipping articles written to meanwhile."""
+        article_ids = [article_id for article_id in counts if article_id in generations]
+        if not article_ids:
+            return
+        keys = []
+        args = []
+        for article_id in article_ids:
+            keys.extend([_count_key(article_id), _gen_key(article_id)])
+            args.extend([generations[article_id], counts[article_id]])
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            await client.eval(
+                _FILL_COUNTS_SCRIPT, len(keys), *keys, COUNT_TTL, *args,
+            )
+        except Exception as e:
+            print(f"[REDIS SET ERROR] comment counts: {e}")
@@ -0,0 +1,168 @@
+"""
+Per-domain scrape health (Redis-backed, shared across instances).
+Tracks how each publisher behaves when scraped: success rate, fetch latency
+and typical extracted length. Domains that keep failing (paywalls, bot
+blocks) are negatively cached so the summary pipeline skips straight to its
+fallback. When the skip window expires one caller probes the domain again;
+every failed probe doubles the window up to SCRAPE_BLOCK_MAX_TTL.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+from app.core.cache import get_redis
+from app.core.config import settings
+from app.core.singleflight import acquire_lock
+
+logger = logging.getLogger(__name__)
+
+STATS_PREFIX = "scrape:domain:"
+BLOCK_PREFIX = "scrape:block:"
+PROBE_PREFIX = "scrape:probe:"
+DOMAINS_KEY = "scrape:domains"
+
+# Stats of domains not scraped for a week are dropped
+STATS_TTL = 7 * 24 * 3600
+# Only one probe per domain at a time; others keep skipping meanwhile
+PROBE_LOCK_TTL = 30
+
+
+class DomainHealth:
+
+    @staticmethod
+    async def should_skip(domain: str) -> bool:
+        """
+        True if the domain is known to fail and should not be scraped now.
+        Once a block expires, the first caller gets to probe it.
+        """
+        if not domain:
+            return False
+        try:
+            client = await get_redis()
+            if client is None:
+                return False
+
+            pipe = client.pipeline(transaction=False)
+            pipe.exists(BLOCK_PREFIX + domain)
+            pipe.hget(STATS_PREFIX + domain, "consecutive_failures")
+            blocked, consecutive = await pipe.execute()
+
+            if blocked:
+                return True
+            if int(consecutive or 0) < settings.SCRAPE_BLOCK_AFTER:
+                return False
+
+            # Block expired but the domain has not recovered yet: probe once
+            token = await acquire_lock(PROBE_PREFIX + domain, PROBE_LOCK_TTL)
+            return token is None
+        except Exception as e:
+            print(f"[REDIS DOMAIN HEALTH ERROR] {domain}: {e}")
+            return False
+
+    @staticmethod
+    async def record(
+        domain: str,
+        success: bool,
+        elapsed_ms: float,
+        chars: int = 0,
+        error: Optional[str] = None,
+    ):
+        """Record one scrape attempt; blocks the domain after repeated failures."""
+        if not domain:
+            return
+        key = STATS_PREFIX + domain
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+
+            pipe = client.pipeline(transaction=False)
+            pipe.hincrby(key, "attempts", 1)
+            pipe.hincrbyfloat(key, "total_ms", round(elapsed_ms, 1))
+            if success:
+                pipe.hincrby(key, "successes", 1)
+                pipe.hincrby(key, "total_chars", chars)
+                pipe.hset(key, mapping={"consecutive_failures": 0, "block_level": 0})
+            else:
+                pipe.hincrby(key, "failures", 1)
+                pipe.hincrby(key, "consecutive_failures", 1)
+            pipe.hset(key, mapping={
+                "last_status": "ok" if success else "failed",
+                "last_error": "" if success else (error or "")[:200],
+                "last_at": int(time.time()),
+            })
+            pipe.expire(key, STATS_TTL)
+            pipe.sadd(DOMAINS_KEY, domain)
+            results = await pipe.execute()
+
+            if success:
+                await client.delete(BLOCK_PREFIX + domain, PROBE_PREFIX + domain)
+                return
+
+            consecutive = results[3]
+            if consecutive >= settings.SCRAPE_BLOCK_AFTER:
+                level = await client.hincrby(key, "block_level", 1)
+                ttl = min(
+                    settings.SCRAPE_BLOCK_TTL * 2 ** (level - 1),
+                    settings.SCRAPE_BLOCK_MAX_TTL,
+                )
+                await client.set(BLOCK_PREFIX + domain, 1, ex=ttl)
+                await client.delete(PROBE_PREFIX + domain)
+                logger.warning(f"[SCRAPE BLOCK] {domain} skipped for {ttl}s after {consecutive} failures")
+        except Exception as e:
+            print(f"[REDIS DOMAIN HEALTH ERROR] {domain}: {e}")
+
+    @staticmethod
+    async def get_stats(limit: int = 100) -> List[Dict]:
+        """Per-domain stats, worst success rate first (admin view)."""
+        try:
+            client = await get_redis()
+            if client is None:
+                return []
+
+            domains = sorted(await client.smembers(DOMAINS_KEY))
+            if not domains:
+                return []
+
+            pipe = client.pipeline(transaction=False)
+            for domain in domains:
+                pipe.hgetall(STATS_PREFIX + domain)
+                pipe.ttl(BLOCK_PREFIX + domain)
+            results = await pipe.execute()
+        except Exception as e:
+            print(f"[REDIS DOMAIN HEALTH ERROR] stats: {e}")
+            return []
+
+        stats = []
+        stale = []
+        for i, domain in enumerate(domains):
+            raw, block_ttl = results[2 * i], results[2 * i + 1]
+            if not raw:
+                stale.append(domain)
+                continue
+
+            attempts = int(raw.get("attempts", 0))
+            successes = int(raw.get("successes", 0))
+            stats.append({
+                "domain": domain,
+                "attempts": attempts,
+                "success_rate": round(successes / attempts, 3) if attempts else 0.0,
+                "avg_ms": round(float(raw.get("total_ms", 0)) / attempts, 1) if attempts else 0.0,
+                "avg_chars": int(int(raw.get("total_chars", 0)) / successes) if successes else 0,
+                "consecutive_failures": int(raw.get("consecutive_failures", 0)),
+                "blocked_for": max(block_ttl, 0),
+                "last_status": raw.get("last_status"),
+                "last_error": raw.get("last_error") or None,
+                "last_at": int(raw.get("last_at", 0)),
+            })
+
+        if stale:
+            # Stats hash expired: forget the domain
+            try:
+                await client.srem(DOMAINS_KEY, *stale)
+            except Exception:
+                pass
+
+        stats.sort(key=lambda s: (s["success_rate"], -s["attempts"]))
+        return stats[:limit]
@@ -0,0 +1,279 @@
+"""
+Corpus-level IDF model for the summarizer.
+Document frequencies are accumulated from ingested article text and persisted
+in MongoDB (`idf_terms` / `idf_meta`); `idf_docs` records which articles were
+counted, so an article re-ingested after an edit is not counted twice.
+The API process loads the terms seen in at least MIN_DF documents (at most
+IDF_MAX_TERMS) once at startup and keeps that table updated in memory; pool
+workers read a JSON snapshot of it that is rewritten periodically. Terms
+still below MIN_DF live only in MongoDB and expire there after
+IDF_RARE_TERM_TTL without being seen again.
+Summarization then only needs a transform against a known IDF table instead
+of fitting a vectorizer per article.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from app.core.config import settings
+from app.core.database import MongoDB
+
+logger = logging.getLogger(__name__)
+
+# Same tokenization as TextSummarizer's per-article vectorizer
+_analyzer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2)).build_analyzer()
+
+# Terms seen in fewer documents are not kept in memory (they get the maximum IDF instead)
+MIN_DF = 2
+# Terms present in more than this share of documents carry no signal
+MAX_DF = 0.85
+
+
+def analyze(text: str) -> List[str]:
+    """Tokenize text into the summarizer's unigram + bigram terms."""
+    return _analyzer(text or "")
+
+
+class IdfModel:
+    """In-memory document-frequency table with smoothed IDF."""
+
+    def __init__(self, doc_count: int = 0, df: Optional[Dict[str, int]] = None):
+        self.doc_count = doc_count
+        self.df: Dict[str, int] = df or {}
+
+    @property
+    def ready(self) -> bool:
+        """Enough documents for corpus IDF to beat per-article fitting."""
+        return self.doc_count >= settings.IDF_MIN_DOCS
+
+    def update(self, documents: int, increments: Dict[str, int], promoted: Dict[str, int]):
+        """
+        Apply a batch already persisted to MongoDB: `documents` new documents,
+        df increments for terms already in the table, and terms that just
+        reached MIN_DF (with their stored df), added while under IDF_MAX_TERMS.
+        """
+        self.doc_count += documents
+        for term, count in increments.items():
+            if term in self.df:
+                self.df[term] += count
+        for term, df in promoted.items():
+            if term in self.df or len(self.df) < settings.IDF_MAX_TERMS:
+                self.df[term] = df
+
+    def idf(self, term: str) -> float:
+        """Smoothed IDF (sklearn formula); unseen terms get the maximum value."""
+        return math.log((1 + self.doc_count) / (1 + self.df.get(term, 0))) + 1
+
+    def transform(self, sentences: List[str]) -> sparse.csr_matrix:
+        """
+        TF-IDF rows for the given sentences, L2-normalized like TfidfVectorizer.
+        Columns are local to this call; only relative values matter for scoring
+        and cosine similarity.
+        """
+        max_df = MAX_DF * self.doc_count
+        columns: Dict[str, int] = {}
+        idf_values: List[float] = []
+        rows, cols, values = [], [], []
+
+        for row, sentence in enumerate(sentences):
+            for term, count in Counter(analyze(sentence)).items():
+                if self.df.get(term, 0) > max_df:
+                    continue
+                col = columns.get(term)
+                if col is None:
+                    col = columns[term] = len(columns)
+                    idf_values.append(self.idf(term))
+                rows.append(row)
+                cols.append(col)
+                values.append(count * idf_values[col])
+
+        matrix = sparse.csr_matrix(
+            (values, (rows, cols)),
+            shape=(len(sentences), max(len(columns), 1)),
+            dtype=np.float64,
+        )
+        norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A1
+        norms[norms == 0] = 1.0
+        return sparse.csr_matrix(matrix.multiply(1 / norms[:, None]))
+
+    # --------------------------------------------------
+    # Snapshot (handoff to pool workers)
+    # --------------------------------------------------
+
+    def save(self, path: str):
+        """Atomically write a JSON snapshot."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"doc_count": self.doc_count, "df": self.df}, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IdfModel":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(doc_count=data.get("doc_count", 0), df=data.get("df", {}))
+
+
+# --------------------------------------------------
+# Process-local model access
+# --------------------------------------------------
+# API process: the live model loaded from MongoDB at startup.
+# Pool workers: lazily loaded from the snapshot, reloaded when it changes.
+_live_model: Optional[IdfModel] = None
+_snapshot_model: Optional[IdfModel] = None
+_snapshot_mtime: float = 0.0
+_docs_since_snapshot = 0
+
+
+def get_idf_model() -> Optional[IdfModel]:
+    """Best available model for this process, or None if not ready."""
+    global _snapshot_model, _snapshot_mtime
+
+    if _live_model is not None:
+        return _live_model if _live_model.ready else None
+
+    try:
+        mtime = os.stat(settings.IDF_SNAPSHOT_PATH).st_mtime
+    except OSError:
+        return None
+
+    if _snapshot_model is None or mtime != _snapshot_mtime:
+        try:
+            _snapshot_model = IdfModel.load(settings.IDF_SNAPSHOT_PATH)
+            _snapshot_mtime = mtime
+        except (OSError, ValueError) as e:
+            logger.warning(f"[IDF] Snapshot load failed: {e}")
+            return None
+
+    return _snapshot_model if _snapshot_model.ready else None
+
+
+class IdfStore:
+    """MongoDB persistence for the corpus IDF model."""
+
+    TERMS = "idf_terms"
+    META = "idf_meta"
+    META_ID = "corpus"
+    DOCS = "idf_docs"
+
+    @staticmethod
+    async def load() -> IdfModel:
+        """Load the model once at startup and publish a snapshot for workers."""
+        global _live_model
+
+        db = MongoDB.get_database()
+        meta = await db[IdfStore.META].find_one({"_id": IdfStore.META_ID}) or {}
+        df = {}
+        cursor = (
+            db[IdfStore.TERMS]
+            .find({"df": {"$gte": MIN_DF}}, projection={"df": 1})
+            .sort("df", -1)
+            .limit(settings.IDF_MAX_TERMS)
+        )
+        async for doc in cursor:
+            df[doc["_id"]] = doc["df"]
+
+        _live_model = IdfModel(doc_count=meta.get("doc_count", 0), df=df)
+        await IdfStore._write_snapshot(_live_model)
+        logger.info(f"[IDF] Loaded corpus model | docs={_live_model.doc_count} | terms={len(df)}")
+        return _live_model
+
+    @staticmethod
+    async def _claim(db, article_ids: List[str]) -> List[str]:
+        """Record articles as counted; returns the ids not counted before."""
+        try:
+            await db[IdfStore.DOCS].insert_many(
+                [{"_id": article_id, "counted_at": datetime.utcnow()} for article_id in article_ids],
+                ordered=False,
+            )
+            return article_ids
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            return [article_id for i, article_id in enumerate(article_ids) if i not in failed]
+
+    @staticmethod
+    async def add_documents(documents: Iterable[Tuple[str, str]]):
+        """
+        Count new documents, given as (article_id, text). Each article id is
+        counted once. MongoDB gets one bulk $inc; the in-memory table then
+        takes the increments for terms it holds plus the terms that have just
+        reached MIN_DF. The worker snapshot is rewritten every
+        IDF_SNAPSHOT_EVERY docs.
+        """
+        global _docs_since_snapshot
+
+        model = _live_model
+        if model is None:
+            return
+
+        terms_by_id: Dict[str, set] = {}
+        for article_id, text in documents:
+            terms = set(analyze(text))
+            if article_id and terms:
+                terms_by_id[article_id] = terms
+
+        if not terms_by_id:
+            return
+
+        try:
+            db = MongoDB.get_database()
+            new_ids = await IdfStore._claim(db, list(terms_by_id))
+            if not new_ids:
+                return
+
+            term_counts: Counter = Counter()
+            for article_id in new_ids:
+                term_counts.update(terms_by_id[article_id])
+
+            now = datetime.utcnow()
+            await db[IdfStore.TERMS].bulk_write(
+                [
+                    UpdateOne({"_id": term}, {"$inc": {"df": count}, "$set": {"last_seen": now}}, upsert=True)
+                    for term, count in term_counts.items()
+                ],
+                ordered=False,
+            )
+            await db[IdfStore.META].update_one(
+                {"_id": IdfStore.META_ID}, {"$inc": {"doc_count": len(new_ids)}}, upsert=True
+            )
+
+            # Terms outside the table are read back only once they qualify
+            unknown = [term for term in term_counts if term not in model.df]
+            promoted = {}
+            if unknown:
+                async for doc in db[IdfStore.TERMS].find(
+                    {"_id": {"$in": unknown}, "df": {"$gte": MIN_DF}}, projection={"df": 1}
+                ):
+                    promoted[doc["_id"]] = doc["df"]
+        except Exception as e:
+            logger.error(f"[IDF ERROR] persist {len(terms_by_id)} docs: {e}")
+            return
+
+        model.update(len(new_ids), term_counts, promoted)
+
+        _docs_since_snapshot += len(new_ids)
+        if _docs_since_snapshot >= settings.IDF_SNAPSHOT_EVERY:
+            _docs_since_snapshot = 0
+            await IdfStore._write_snapshot(model)
+
+    @staticmethod
+    async def _write_snapshot(model: IdfModel):
+        # Copy on the loop thread; the live dict keeps changing while the file is written
+        frozen = IdfModel(doc_count=model.doc_count, df=dict(model.df))
+        try:
+            await asyncio.to_thread(frozen.save, settings.IDF_SNAPSHOT_PATH)
+        except OSError as e:
+            logger.error(f"[IDF ERROR] snapshot: {e}")
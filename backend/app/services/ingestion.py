@@ -0,0 +1,163 @@
+"""
+Incremental feed ingestion.
+Each refresh is diffed against the previous feed for the same category by
+article id. Unchanged articles carry their derived fields (sentiment) forward,
+so only new or edited articles go through the ML model and refresh cost is
+proportional to churn rather than feed size.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+from app.core.cache import get_from_cache, set_in_cache
+from app.services.article_store import ArticleStore
+from app.services.idf_model import IdfStore
+from app.services.news_service import (
+    GNewsService,
+    MAX_ARTICLES,
+    DEFAULT_COUNTRY,
+    DEFAULT_LANG,
+    feed_cache_key,
+    normalize_feed_params,
+)
+from app.services.sentiment_ml import SentimentService
+from app.services.summary_service import schedule_summaries
+
+logger = logging.getLogger(__name__)
+
+# Fields computed by us (not GNews) that survive a refresh when the article is unchanged
+DERIVED_FIELDS = ("sentiment",)
+
+
+def _fingerprint(article: Dict) -> Tuple:
+    """Fields whose change means derived data must be recomputed."""
+    return (
+        article.get("title") or "",
+        article.get("description") or "",
+        article.get("content") or "",
+    )
+
+
+def diff_feeds(previous: List[Dict], fresh: List[Dict]) -> Dict[str, int]:
+    """
+    Diff a fresh fetch against the previous feed by article id.
+    Derived fields are copied onto unchanged fresh articles in place.
+    Returns counts of new, updated, unchanged and dropped articles.
+    """
+    previous_by_id = {article.get("id"): article for article in previous if article.get("id")}
+    fresh_ids = set()
+    stats = {"new": 0, "updated": 0, "unchanged": 0, "dropped": 0, "total": len(fresh)}
+
+    for article in fresh:
+        article_id = article.get("id")
+        fresh_ids.add(article_id)
+        old = previous_by_id.get(article_id)
+
+        if old is None:
+            stats["new"] += 1
+            continue
+
+        if _fingerprint(old) != _fingerprint(article):
+            stats["updated"] += 1
+            continue
+
+        stats["unchanged"] += 1
+        for field in DERIVED_FIELDS:
+            if old.get(field) is not None:
+                article[field] = old[field]
+
+    stats["dropped"] = len(set(previous_by_id) - fresh_ids)
+    return stats
+
+
+async def add_sentiment_to_articles(articles):
+    """
+    Calculate sentiment for each article using ML model.
+    Combines title + description + content for analysis.
+    Includes Redis caching to avoid repeated ML inference.
+    Stories already archived (e.g. seen under another category) reuse
+    their stored sentiment instead of being scored again.
+    """
+    archived = await ArticleStore.get_many(article.get("id") for article in articles)
+
+    for article in articles:
+        known = archived.get(article.get("id"))
+        if known and known.get("sentiment") and _fingerprint(known) == _fingerprint(article):
+            article["sentiment"] = known["sentiment"]
+            continue
+
+        # Use ML service to analyze article sentiment (checks Redis cache first)
+        sentiment_result = await SentimentService.analyze_article(
+            title=article.get('title', ''),
+            description=article.get('description', ''),
+            content=article.get('content', '')
+        )
+
+        # Attach sentiment to article
+        article["sentiment"] = {
+            "label": sentiment_result["label"],
+            "confidence": sentiment_result["confidence"],
+            "model": sentiment_result["model"]
+        }
+
+    return articles
+
+
+def archive_more_key(cache_key: str) -> str:
+    """Whether the archive holds older stories past the end of a cached feed."""
+    return "archive_more:" + cache_key
+
+
+async def ingest_category(
+    category: str,
+    country: str = DEFAULT_COUNTRY,
+    lang: str = DEFAULT_LANG,
+) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Fetch a category from GNews (1 hit), process only what changed since the
+    previous feed, then write the feed cache and the archive.
+    Raises whatever GNewsService raises; the previous cache is left intact.
+    """
+    category, country, lang = normalize_feed_params(category, country, lang)
+    cache_key = feed_cache_key(category, country, lang)
+
+    # Previous feed: the cached one, or the archive's view of it once the cache expired
+    previous = await get_from_cache(cache_key)
+    if not previous:
+        previous = await ArticleStore.recent_by_category(
+            category, limit=MAX_ARTICLES, country=country, lang=lang
+        )
+
+    articles = await GNewsService.fetch_category(category, country, lang)
+    stats = diff_feeds(previous or [], articles)
+
+    # Only new/edited articles go through the model
+    pending = [article for article in articles if not article.get("sentiment")]
+    if pending:
+        await add_sentiment_to_articles(pending)
+        # New text also feeds the summarizer's corpus IDF
+        await IdfStore.add_documents(
+            (article.get("id"), " ".join(_fingerprint(article))) for article in pending
+        )
+
+    await set_in_cache(cache_key, articles)
+    await ArticleStore.upsert_articles(articles, category)
+
+    # Probed once per refresh so page reads never query the archive just for has_more
+    older = await ArticleStore.recent_by_category(
+        category,
+        limit=1,
+        country=country,
+        lang=lang,
+        exclude_ids=[article.get("id") for article in articles],
+    )
+    await set_in_cache(archive_more_key(cache_key), {"has_more": bool(older)})
+
+    # Summaries for new/edited stories are prepared before anyone asks
+    schedule_summaries(pending)
+
+    logger.info(
+        f"[INGEST] {cache_key} | new={stats['new']} | updated={stats['updated']} "
+        f"| unchanged={stats['unchanged']} | dropped={stats['dropped']}"
+    )
+    return articles, stats
@@ -1,8 +1,8 @@
 import httpx
-import hashlib
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from app.core.config import settings
 from app.core.gnews_counter import GNewsCounter  # ✅ Added
+from app.services.url_utils import canonicalize_url, article_id_for
 
 ALLOWED_CATEGORIES = [
     "general",
@@ -14,13 +14,72 @@ ALLOWED_CATEGORIES = [
     "health",
 ]
 
+# Locales supported by GNews top-headlines
+ALLOWED_COUNTRIES = [
+    "au", "br", "ca", "cn", "eg", "fr", "de", "gr", "hk", "in", "ie", "il",
+    "it", "jp", "nl", "no", "pk", "pe", "ph", "pt", "ro", "ru", "sg", "es",
+    "se", "ch", "tw", "ua", "gb", "us",
+]
+ALLOWED_LANGS = [
+    "ar", "zh", "nl", "en", "fr", "de", "el", "he", "hi", "it", "ja", "ml",
+    "mr", "no", "pt", "ro", "ru", "es", "sv", "ta", "te", "uk",
+]
+
+DEFAULT_CATEGORY = "general"
+DEFAULT_COUNTRY = "in"
+DEFAULT_LANG = "en"
+
 MAX_ARTICLES = 20  # HARD CAP
 
+
+def normalize_feed_params(
+    category: Optional[str],
+    country: Optional[str] = None,
+    lang: Optional[str] = None,
+) -> Tuple[str, str, str]:
+    """
+    Canonicalize feed parameters (case, whitespace, unsupported values)
+    so equivalent requests always map to the same upstream call and cache key.
+    """
+    category = (category or "").strip().lower()
+    country = (country or "").strip().lower()
+    lang = (lang or "").strip().lower()
+
+    if category not in ALLOWED_CATEGORIES:
+        category = DEFAULT_CATEGORY
+    if country not in ALLOWED_COUNTRIES:
+        country = DEFAULT_COUNTRY
+    if lang not in ALLOWED_LANGS:
+        lang = DEFAULT_LANG
+
+    return category, country, lang
+
+
+def feed_cache_key(
+    category: Optional[str],
+    country: Optional[str] = None,
+    lang: Optional[str] = None,
+) -> str:
+    """
+    Canonical Redis key for a feed.
+    The default locale keeps the historical `gnews:{category}` key;
+    other locales are namespaced as `gnews:{category}:{country}:{lang}`.
+    Pagination is NOT part of the key: pages are slices of one cached feed.
+    """
+    category, country, lang = normalize_feed_params(category, country, lang)
+    if country == DEFAULT_COUNTRY and lang == DEFAULT_LANG:
+        return f"gnews:{category}"
+    return f"gnews:{category}:{country}:{lang}"
+
+
 class GNewsService:
     @staticmethod
-    async def fetch_category(category: str) -> List[Dict]:
-        if category not in ALLOWED_CATEGORIES:
-            category = "general"
+    async def fetch_category(
+        category: str,
+        country: str = DEFAULT_COUNTRY,
+        lang: str = DEFAULT_LANG,
+    ) -> List[Dict]:
+        category, country, lang = normalize_feed_params(category, country, lang)
 
         # ✅ Check API limit before calling
         can_call, message = await GNewsCounter.check_limit()
@@ -29,8 +88,8 @@ class GNewsService:
 
         params = {
             "category": category,
-            "country": "in",
-            "lang": "en",
+            "country": country,
+            "lang": lang,
             "max": MAX_ARTICLES,
             "apikey": settings.GNEWS_API_KEY,
         }
@@ -48,14 +107,17 @@ class GNewsService:
 
         data = response.json()
         articles = []
+        seen_ids = set()
 
         for item in data.get("articles", []):
             if not item.get("title") or not item.get("url"):
                 continue
 
-            article_id = hashlib.md5(
-                item["url"].encode()
-            ).hexdigest()
+            # ✅ Identity is the canonical URL, so tracking/AMP variants collapse
+            article_id = article_id_for(item["url"])
+            if article_id in seen_ids:
+                continue
+            seen_ids.add(article_id)
 
             articles.append({
                 "id": article_id,
@@ -65,8 +127,11 @@ class GNewsService:
                 "image_url": item.get("image"),
                 "source": item.get("source", {}).get("name"),
                 "url": item["url"],
+                "canonical_url": canonicalize_url(item["url"]),
                 "published_at": item.get("publishedAt"),
                 "category": category,
+                "country": country,
+                "lang": lang,
             })
 
         # ✅ Increment hit counter only when at least one valid article is returned
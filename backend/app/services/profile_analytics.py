@@ -0,0 +1,272 @@
+"""
+Profile analytics over a user's saved items.
+Bookmarks and read-later items are combined with $unionWith and summarized
+by a single $facet stage (counts, categories, daily activity, sentiment),
+so the whole profile costs one aggregation plus one summary_logs count.
+"""
+
+import asyncio
+import json
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from app.core.cache import get_redis
+
+SENTIMENT_LABELS = ("Positive", "Neutral", "Negative")
+
+# Days shown in the weekly activity chart (today included)
+ACTIVITY_DAYS = 7
+
+
+def _saved_items_stage(user_id: str, kind: str):
+    """Fields each saved item contributes to the facets, tagged with its collection."""
+    return [
+        {"$match": {"user_id": user_id}},
+        {"$project": {
+            "_id": 0,
+            "kind": {"$literal": kind},
+            "category": 1,
+            "created_at": 1,
+            "sentiment_label": "$sentiment.label",
+        }},
+    ]
+
+
+def saved_items_pipeline(user_id: str, since: datetime):
+    """
+    One pass over bookmarks ∪ read_later for a user. `since` bounds the
+    daily activity facet; everything else covers all items.
+    """
+    return [
+        *_saved_items_stage(user_id, "bookmarks"),
+        {"$unionWith": {"coll": "read_later", "pipeline": _saved_items_stage(user_id, "read_later")}},
+        {"$facet": {
+            "counts": [
+                {"$group": {
+                    "_id": "$kind",
+                    "count": {"$sum": 1},
+                    "last_active_at": {"$max": "$created_at"},
+                }},
+            ],
+            "categories": [
+                {"$match": {"category": {"$nin": [None, ""]}}},
+                {"$group": {"_id": "$category", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1, "_id": 1}},
+            ],
+            "daily": [
+                {"$match": {"created_at": {"$gte": since}}},
+                {"$group": {
+                    "_id": {"$dateTrunc": {"date": "$created_at", "unit": "day"}},
+                    "count": {"$sum": 1},
+                }},
+            ],
+            "sentiment": [
+                {"$match": {"sentiment_label": {"$in": list(SENTIMENT_LABELS)}}},
+                {"$group": {"_id": "$sentiment_label", "count": {"$sum": 1}}},
+            ],
+        }},
+    ]
+
+
+async def aggregate_saved_items(db, user_id: str, since: datetime) -> Dict:
+    """
+    Run the saved-items aggregation and flatten its facets:
+    {bookmarks, read_later, last_active_at, categories, daily, sentiment}
+    """
+    rows = await db.bookmarks.aggregate(saved_items_pipeline(user_id, since)).to_list(length=1)
+    facets = rows[0] if rows else {}
+
+    counts = {row["_id"]: row for row in facets.get("counts", [])}
+    last_active = [row.get("last_active_at") for row in counts.values() if row.get("last_active_at")]
+
+    return {
+        "bookmarks": int(counts.get("bookmarks", {}).get("count", 0)),
+        "read_later": int(counts.get("read_later", {}).get("count", 0)),
+        "last_active_at": max(last_active) if last_active else None,
+        "categories": {row["_id"]: int(row["count"]) for row in facets.get("categories", [])},
+        "daily": {row["_id"].date(): int(row["count"]) for row in facets.get("daily", []) if row.get("_id")},
+        "sentiment": {row["_id"]: int(row["count"]) for row in facets.get("sentiment", [])},
+    }
+
+
+def engagement(articles_read: int, bookmarks: int, read_later: int):
+    score = articles_read + (bookmarks * 2) + read_later
+    if score < 10:
+        label = "Casual Reader"
+    elif score <= 25:
+        label = "Active Reader"
+    else:
+        label = "Power Reader"
+    return score, label
+
+
+def build_analytics(
+    articles_read: int,
+    bookmarks: int,
+    read_later: int,
+    last_active_at: Optional[datetime],
+    categories: Dict[str, int],
+    daily: Dict[date, int],
+    sentiment: Dict[str, int],
+    today: Optional[date] = None,
+) -> Dict:
+    """Shape aggregated counts into the /profile/analytics response."""
+    today = today or datetime.utcnow().date()
+
+    category_breakdown = [
+        {"category": category, "count": count}
+        for category, count in sorted(categories.items(), key=lambda item: (-item[1], item[0]))
+        if count > 0
+    ]
+    top_category = category_breakdown[0]["category"] if category_breakdown else None
+
+    weekly_activity = []
+    for i in range(ACTIVITY_DAYS - 1, -1, -1):
+        day = today - timedelta(days=i)
+        weekly_activity.append({"day": day.strftime("%a"), "count": daily.get(day, 0)})
+
+    sentiment_counts = {label: sentiment.get(label, 0) for label in SENTIMENT_LABELS}
+    sentiment_found = any(sentiment_counts.values())
+
+    engagement_score, engagement_label = engagement(articles_read, bookmarks, read_later)
+
+    return {
+        "tier1": {
+            "articles_read": articles_read,
+            "bookmarks": bookmarks,
+            "read_later": read_later,
+            "total_saved": bookmarks + read_later,
+            "last_active_at": last_active_at,
+        },
+        "tier2": {
+            "top_category": top_category,
+            "category_breakdown": category_breakdown,
+            "weekly_activity": weekly_activity,
+        },
+        "tier3": {
+            "sentiment_breakdown": sentiment_counts if sentiment_found else None,
+            "engagement_score": engagement_score,
+            "engagement_label": engagement_label,
+        },
+    }
+
+
+async def compute_profile_analytics(db, user_id: str) -> Dict:
+    """Profile analytics in two concurrent round trips."""
+    today = datetime.utcnow().date()
+    since = datetime.combine(today - timedelta(days=ACTIVITY_DAYS - 1), datetime.min.time())
+
+    saved, articles_read = await asyncio.gather(
+        aggregate_saved_items(db, user_id, since),
+        db.summary_logs.count_documents({"user_id": user_id}),
+    )
+
+    return build_analytics(articles_read=articles_read, today=today, **saved)
+
+
+# --------------------------------------------------
+# RESPONSE CACHE
+# --------------------------------------------------
+class ProfileCache:
+    """
+    Per-user cache of the /profile/analytics response.
+    Entries are dropped by the write paths that change a user's numbers
+    (UserStats), so no short TTL is needed; they only expire at UTC
+    midnight, when the weekly activity window moves.
+
+    Each invalidation also bumps a per-user version. A reader that missed
+    stores its result only if the version is unchanged, so a write landing
+    between its stats read and its cache write can't leave stale numbers.
+    """
+
+    KEY_PREFIX = "profile:analytics:"
+    VERSION_PREFIX = "profile:analytics:ver:"
+    HITS_KEY = "stats:profile_cache:hits"
+    MISSES_KEY = "stats:profile_cache:misses"
+
+    # Store only if nobody invalidated since the reader looked
+    _SET_IF_VERSION_SCRIPT = """
+if (redis.call('get', KEYS[2]) or '0') == ARGV[1] then
+    return redis.call('setex', KEYS[1], ARGV[2], ARGV[3])
+end
+return 0
+"""
+
+    @staticmethod
+    def _seconds_until_midnight() -> int:
+        now = datetime.utcnow()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        return max(int((midnight - now).total_seconds()), 1)
+
+    @staticmethod
+    async def get(user_id: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Returns (cached response or None, version to pass to set())."""
+        try:
+            client = await get_redis()
+            if client is None:
+                return None, None
+
+            pipe = client.pipeline(transaction=False)
+            pipe.get(ProfileCache.KEY_PREFIX + user_id)
+            pipe.get(ProfileCache.VERSION_PREFIX + user_id)
+            raw, version = await pipe.execute()
+
+            await client.incr(ProfileCache.HITS_KEY if raw else ProfileCache.MISSES_KEY)
+            return (json.loads(raw) if raw else None), (version or "0")
+        except Exception as e:
+            print(f"[REDIS GET ERROR] profile analytics {user_id}: {e}")
+            return None, None
+
+    @staticmethod
+    async def set(user_id: str, analytics: Dict, version: Optional[str]):
+        """analytics must be JSON-serializable (run it through jsonable_encoder)."""
+        if version is None:
+            return
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            await client.eval(
+                ProfileCache._SET_IF_VERSION_SCRIPT,
+                2,
+                ProfileCache.KEY_PREFIX + user_id,
+                ProfileCache.VERSION_PREFIX + user_id,
+                version,
+                ProfileCache._seconds_until_midnight(),
+                json.dumps(analytics),
+            )
+        except Exception as e:
+            print(f"[REDIS SET ERROR] profile analytics {user_id}: {e}")
+
+    @staticmethod
+    async def invalidate(user_id: str):
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            pipe = client.pipeline(transaction=False)
+            pipe.delete(ProfileCache.KEY_PREFIX + user_id)
+            pipe.incr(ProfileCache.VERSION_PREFIX + user_id)
+            # Only needs to outlive in-flight readers
+            pipe.expire(ProfileCache.VERSION_PREFIX + user_id, 24 * 3600)
+            await pipe.execute()
+        except Exception as e:
+            print(f"[REDIS DELETE ERROR] profile analytics {user_id}: {e}")
+
+    @staticmethod
+    async def hit_rate() -> Dict:
+        hits = misses = 0
+        try:
+            client = await get_redis()
+            if client is not None:
+                raw_hits, raw_misses = await client.mget(ProfileCache.HITS_KEY, ProfileCache.MISSES_KEY)
+                hits, misses = int(raw_hits or 0), int(raw_misses or 0)
+        except Exception as e:
+            print(f"[REDIS GET ERROR] profile cache stats: {e}")
+
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 3) if total else 0.0,
+        }
@@ -0,0 +1,110 @@
+"""
+Bulk write and export helpers shared by bookmarks and read-later.
+Duplicate detection relies on the unique (user_id, article_id) index
+(idx_user_article_unique) instead of a find-before-insert, so imports cost
+one round trip per batch and concurrent saves can't create duplicates.
+"""
+
+import json
+from datetime import datetime
+from typing import AsyncIterator, Dict, List
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.errors import BulkWriteError
+
+from app.services.saved_state import SavedState
+from app.services.user_stats import UserStats
+
+# Max items accepted by one bulk save/remove request
+MAX_BULK_ITEMS = 1000
+
+DUPLICATE_KEY_ERROR = 11000
+
+EXPORT_BATCH_SIZE = 500
+
+
+async def insert_items(collection, kind: str, user_id: str, docs: List[Dict]) -> Dict:
+    """
+    insert_many(ordered=False): every insertable document goes in, and
+    per-document failures are reported instead of aborting the batch.
+    kind is the stats bucket, "bookmarks" or "read_later".
+    """
+    if not docs:
+        return {"inserted": 0, "ids": [], "duplicates": [], "failed": []}
+
+    for doc in docs:
+        doc["user_id"] = user_id
+
+    failed_indexes = {}
+    try:
+        await collection.insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        for error in e.details.get("writeErrors", []):
+            failed_indexes[error["index"]] = error.get("code")
+
+    inserted = [doc for i, doc in enumerate(docs) if i not in failed_indexes]
+    duplicates = [docs[i]["article_id"] for i, code in failed_indexes.items() if code == DUPLICATE_KEY_ERROR]
+    failed = [docs[i]["article_id"] for i, code in failed_indexes.items() if code != DUPLICATE_KEY_ERROR]
+
+    if inserted:
+        await UserStats.record_saved_many(user_id, kind, inserted)
+        await SavedState.record_added(user_id, kind, [doc["article_id"] for doc in inserted])
+
+    return {
+        "inserted": len(inserted),
+        "ids": [str(doc["_id"]) for doc in inserted],
+        "duplicates": duplicates,
+        "failed": failed,
+    }
+
+
+async def delete_items(collection, kind: str, user_id: str, ids: List[str]) -> Dict:
+    """
+    Delete the user's items by id. The documents are read first (projection
+    of the stats fields only) so the right stats buckets are decremented.
+    """
+    object_ids = []
+    invalid = []
+    for item_id in dict.fromkeys(ids):
+        try:
+            object_ids.append(ObjectId(item_id))
+        except (InvalidId, TypeError):
+            invalid.append(item_id)
+
+    query = {"_id": {"$in": object_ids}, "user_id": user_id}
+    found = await collection.find(
+        query,
+        projection={"article_id": 1, "category": 1, "sentiment": 1, "created_at": 1},
+    ).to_list(length=len(object_ids))
+
+    deleted = 0
+    if found:
+        result = await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in found]}, "user_id": user_id})
+        deleted = result.deleted_count
+        await UserStats.record_unsaved_many(user_id, kind, found)
+        await SavedState.record_removed(user_id, kind, [doc.get("article_id") for doc in found])
+
+    found_ids = {str(doc["_id"]) for doc in found}
+    return {
+        "deleted": deleted,
+        "not_found": [str(oid) for oid in object_ids if str(oid) not in found_ids] + invalid,
+    }
+
+
+def _export_line(doc: Dict) -> str:
+    doc["_id"] = str(doc["_id"])
+    if isinstance(doc.get("created_at"), datetime):
+        doc["created_at"] = doc["created_at"].isoformat()
+    return json.dumps(doc, default=str) + "\n"
+
+
+async def export_items(collection, user_id: str, projection: Dict[str, int]) -> AsyncIterator[str]:
+    """NDJSON lines, newest first, streamed from the cursor batch by batch."""
+    cursor = (
+        collection.find({"user_id": user_id}, projection=projection)
+        .sort([("created_at", -1), ("_id", -1)])
+        .batch_size(EXPORT_BATCH_SIZE)
+    )
+    async for doc in cursor:
+        yield _export_line(doc)
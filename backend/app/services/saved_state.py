@@ -0,0 +1,190 @@
+"""
+"Is this article saved?" lookups for feed rendering.
+Each user's saved article ids are mirrored per collection in a Redis set
+(saved:<collection>:<user_id>). A sentinel member marks the set as complete:
+only then can a missing id be read as "not saved". Incomplete sets fall back
+to one $in query per collection and are loaded in the background.
+
+Writes keep loaded sets current (SADD/SREM) and bump a per-set generation;
+a background load only publishes its set if no write happened while it was
+reading Mongo, so a load can never resurrect a removed id or drop a new one.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Set
+
+from app.core.cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Collection -> flag name in the lookup response
+KINDS = {"bookmarks": "bookmarked", "read_later": "read_later"}
+
+SENTINEL = "__loaded__"
+SET_TTL = 24 * 3600
+# Users with more saved items than this are answered from Mongo only
+MAX_CACHED_ITEMS = 5000
+
+# ARGV: op ("add" | "remove"), ttl, ids...
+_WRITE_SCRIPT = """
+redis.call('incr', KEYS[2])
+redis.call('expire', KEYS[2], ARGV[2])
+if redis.call('sismember', KEYS[1], ARGV[3]) == 1 then
+    for i = 4, #ARGV do
+        if ARGV[1] == 'add' then
+            redis.call('sadd', KEYS[1], ARGV[i])
+        else
+            redis.call('srem', KEYS[1], ARGV[i])
+        end
+    end
+end
+return 1
+"""
+
+# ARGV: expected generation, ttl, sentinel, ids...
+_LOAD_SCRIPT = """
+if (redis.call('get', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('del', KEYS[1])
+for i = 3, #ARGV do
+    redis.call('sadd', KEYS[1], ARGV[i])
+end
+redis.call('expire', KEYS[1], ARGV[2])
+return 1
+"""
+
+# One background load per set at a time
+_load_tasks: Dict[str, asyncio.Task] = {}
+
+
+def _set_key(kind: str, user_id: str) -> str:
+    return f"saved:{kind}:{user_id}"
+
+
+def _gen_key(kind: str, user_id: str) -> str:
+    return f"saved:{kind}:{user_id}:gen"
+
+
+class SavedState:
+
+    @staticmethod
+    async def _record(op: str, user_id: str, kind: str, article_ids: Iterable[str]):
+        ids = [a for a in article_ids if a]
+        if not ids:
+            return
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            await client.eval(
+                _WRITE_SCRIPT, 2, _set_key(kind, user_id), _gen_key(kind, user_id),
+                op, SET_TTL, SENTINEL, *ids,
+            )
+        except Exception as e:
+            print(f"[REDIS SAVED STATE ERROR] {kind}:{user_id}: {e}")
+
+    @staticmethod
+    async def record_added(user_id: str, kind: str, article_ids: Iterable[str]):
+        """Call after the Mongo insert succeeded."""
+        await SavedState._record("add", user_id, kind, article_ids)
+
+    @staticmethod
+    async def record_removed(user_id: str, kind: str, article_ids: Iterable[str]):
+        """Call after the Mongo delete succeeded."""
+        await SavedState._record("remove", user_id, kind, article_ids)
+
+    @staticmethod
+    async def forget(user_id: str, kind: str):
+        """Drop the user's set (reloaded on the next lookup) after ids were rewritten."""
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            pipe = client.pipeline(transaction=False)
+            pipe.incr(_gen_key(kind, user_id))
+            pipe.expire(_gen_key(kind, user_id), SET_TTL)
+            pipe.delete(_set_key(kind, user_id))
+            await pipe.execute()
+        except Exception as e:
+            print(f"[REDIS SAVED STATE ERROR] forget {kind}:{user_id}: {e}")
+
+    @staticmethod
+    async def _load(db, user_id: str, kind: str, generation: str):
+        """Mirror the user's saved ids into Redis (background, best-effort)."""
+        try:
+            collection = db[kind]
+            if await collection.count_documents({"user_id": user_id}, limit=MAX_CACHED_ITEMS + 1) > MAX_CACHED_ITEMS:
+                return
+            article_ids = await collection.distinct("article_id", {"user_id": user_id})
+
+            client = await get_redis()
+            if client is None:
+                return
+            await client.eval(
+                _LOAD_SCRIPT, 2, _set_key(kind, user_id), _gen_key(kind, user_id),
+                generation, SET_TTL, SENTINEL, *[a for a in article_ids if a],
+            )
+        except Exception as e:
+            logger.warning(f"[SAVED STATE] load failed for {kind}:{user_id}: {e}")
+
+    @staticmethod
+    def _schedule_load(db, user_id: str, kind: str, generation: str):
+        key = _set_key(kind, user_id)
+        if key in _load_tasks:
+            return
+        task = asyncio.create_task(SavedState._load(db, user_id, kind, generation))
+        # Keep a reference so the task is not garbage-collected mid-flight
+        _load_tasks[key] = task
+        task.add_done_callback(lambda _: _load_tasks.pop(key, None))
+
+    @staticmethod
+    async def lookup(db, user_id: str, article_ids: List[str]) -> Dict[str, Dict[str, bool]]:
+        """{article_id: {"bookmarked": bool, "read_later": bool}} for the given ids."""
+        ids = list(dict.fromkeys(a for a in article_ids if a))
+        states = {article_id: {flag: False for flag in KINDS.values()} for article_id in ids}
+        if not ids:
+            return states
+
+        # One pipelined round trip: membership of sentinel + ids, and generation, per set
+        cached: Dict[str, List[int]] = {}
+        generations: Dict[str, str] = {}
+        try:
+            client = await get_redis()
+            if client is not None:
+                pipe = client.pipeline(transaction=False)
+                for kind in KINDS:
+                    pipe.smismember(_set_key(kind, user_id), [SENTINEL, *ids])
+                    pipe.get(_gen_key(kind, user_id))
+                results = await pipe.execute()
+                for i, kind in enumerate(KINDS):
+                    members, generation = results[2 * i], results[2 * i + 1]
+                    generations[kind] = generation or "0"
+                    if members and members[0]:
+                        cached[kind] = members[1:]
+        except Exception as e:
+            print(f"[REDIS SAVED STATE ERROR] lookup {user_id}: {e}")
+
+        async def from_mongo(kind: str) -> Set[str]:
+            rows = await db[kind].find(
+                {"user_id": user_id, "article_id": {"$in": ids}},
+                projection={"_id": 0, "article_id": 1},
+            ).to_list(length=len(ids))
+            return {row["article_id"] for row in rows}
+
+        missing = [kind for kind in KINDS if kind not in cached]
+        found = await asyncio.gather(*(from_mongo(kind) for kind in missing))
+
+        for kind, flag in KINDS.items():
+            if kind in cached:
+                for article_id, member in zip(ids, cached[kind]):
+                    states[article_id][flag] = bool(member)
+            else:
+                saved = found[missing.index(kind)]
+                for article_id in ids:
+                    states[article_id][flag] = article_id in saved
+                if kind in generations:
+                    SavedState._schedule_load(db, user_id, kind, generations[kind])
+
+        return states
@@ -1,17 +1,30 @@
 import re
 import numpy as np
-from typing import List
+from typing import List, Optional
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+from app.services.idf_model import IdfModel, get_idf_model
+
+
+# Bump whenever selection/scoring changes output, so stored summaries are recomputed
+SUMMARIZER_VERSION = "2"
+
 
 class TextSummarizer:
     """
     High-quality extractive NLP summarizer (NO AI / NO APIs)
     Optimized for news articles.
+
+    Stateless and re-entrant: every call builds its own vectorizer, so one
+    instance can be shared across concurrent requests and worker processes.
     """
 
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(
+    SELECTION_MODES = ("greedy", "mmr")
+
+    @staticmethod
+    def _build_vectorizer() -> TfidfVectorizer:
+        return TfidfVectorizer(
             stop_words="english",
             ngram_range=(1, 2),
             max_df=0.85,
@@ -25,7 +38,22 @@ class TextSummarizer:
         min_words: int = 100,
         max_words: int = 120,
         max_sentences: int = 10,
+        selection: str = "greedy",
+        mmr_lambda: float = 0.7,
+        idf_model: Optional[IdfModel] = None,
     ) -> str:
+        """
+        idf_model: corpus IDF to transform against; without it a vectorizer
+        is fitted on this article's sentences alone.
+
+        selection:
+        - "greedy": rank by score, skip sentences with >60% word overlap
+        - "mmr": Maximal Marginal Relevance on TF-IDF cosine similarity,
+          trading relevance against redundancy with mmr_lambda (1.0 = relevance only)
+        """
+        if selection not in self.SELECTION_MODES:
+            raise ValueError(f"Unknown selection mode: {selection}")
+
         sentences = self._split_sentences(text)
 
         if not sentences:
@@ -33,18 +61,60 @@ class TextSummarizer:
 
         full_text = " ".join(sentences).strip()
 
+        # Token counts computed once; reused by selection and length checks
+        lengths = [len(s.split()) for s in sentences]
+
         # Avoid TF-IDF empty vocabulary errors when too few sentences
         if len(sentences) < 2:
             return full_text
 
-        if len(full_text.split()) <= min_words:
+        if sum(lengths) <= min_words:
             return full_text
 
         try:
-            scores = self._score(sentences)
+            tfidf = self._tfidf(sentences, idf_model)
         except ValueError:
             return full_text
 
+        scores = self._score_matrix(tfidf)
+
+        if selection == "mmr":
+            selected = self._select_mmr(
+                tfidf, scores, lengths,
+                min_words=min_words,
+                max_sentences=max_sentences,
+                mmr_lambda=mmr_lambda,
+            )
+        else:
+            selected = self._select_greedy(
+                sentences, scores, lengths,
+                min_words=min_words,
+                max_sentences=max_sentences,
+            )
+
+        selected.sort()
+
+        summary = " ".join(sentences[idx] for idx in selected)
+        words = summary.split()
+
+        if len(words) > max_words:
+            summary = " ".join(words[:max_words]).rstrip() + "…"
+
+        return summary
+
+    # --------------------------------------------------
+    # Selection strategies (return sentence indices)
+    # --------------------------------------------------
+
+    def _select_greedy(
+        self,
+        sentences: List[str],
+        scores: np.ndarray,
+        lengths: List[int],
+        *,
+        min_words: int,
+        max_sentences: int,
+    ) -> List[int]:
         ranked = np.argsort(scores)[::-1]
 
         selected = []
@@ -52,30 +122,58 @@ class TextSummarizer:
         word_count = 0
 
         for idx in ranked:
-            sentence = sentences[idx]
-            words = set(sentence.lower().split())
+            words = set(sentences[idx].lower().split())
 
             # ❌ Skip highly redundant sentences
             overlap = len(words & used_words) / max(len(words), 1)
             if overlap > 0.6:
                 continue
 
-            selected.append((idx, sentence))
+            selected.append(int(idx))
             used_words |= words
-            word_count += len(sentence.split())
+            word_count += lengths[idx]
 
             if word_count >= min_words or len(selected) >= max_sentences:
                 break
 
-        selected.sort(key=lambda x: x[0])
+        return selected
 
-        summary = " ".join(s for _, s in selected)
-        words = summary.split()
+    def _select_mmr(
+        self,
+        tfidf: sparse.csr_matrix,
+        scores: np.ndarray,
+        lengths: List[int],
+        *,
+        min_words: int,
+        max_sentences: int,
+        mmr_lambda: float,
+    ) -> List[int]:
+        # TF-IDF rows are L2-normalized, so a sparse dot product is cosine similarity.
+        # Only rows for picked sentences are computed: O(k·n) instead of an n×n matrix.
+        top = scores.max()
+        relevance = scores / top if top > 0 else scores
+        max_similarity = np.zeros(len(scores))
+        available = np.ones(len(scores), dtype=bool)
 
-        if len(words) > max_words:
-            summary = " ".join(words[:max_words]).rstrip() + "…"
+        selected = []
+        word_count = 0
 
-        return summary
+        while available.any():
+            mmr = mmr_lambda * relevance - (1 - mmr_lambda) * max_similarity
+            mmr[~available] = -np.inf
+            idx = int(np.argmax(mmr))
+            available[idx] = False
+
+            selected.append(idx)
+            word_count += lengths[idx]
+
+            if word_count >= min_words or len(selected) >= max_sentences:
+                break
+
+            similarity = (tfidf @ tfidf[idx].T).toarray().ravel()
+            np.maximum(max_similarity, similarity, out=max_similarity)
+
+        return selected
 
     # --------------------------------------------------
     # Helpers
@@ -90,8 +188,15 @@ class TextSummarizer:
             if len(s.strip()) > 50
         ]
 
-    def _score(self, sentences: List[str]) -> np.ndarray:
-        tfidf = self.vectorizer.fit_transform(sentences)
+    def _tfidf(self, sentences: List[str], idf_model: Optional[IdfModel] = None) -> sparse.csr_matrix:
+        if idf_model is not None:
+            return idf_model.transform(sentences)
+        return self._build_vectorizer().fit_transform(sentences)
+
+    def _score(self, sentences: List[str], idf_model: Optional[IdfModel] = None) -> np.ndarray:
+        return self._score_matrix(self._tfidf(sentences, idf_model))
+
+    def _score_matrix(self, tfidf: sparse.csr_matrix) -> np.ndarray:
         scores = tfidf.sum(axis=1).A1
 
         # 📰 Strong lead bias (news articles)
@@ -99,3 +204,17 @@ class TextSummarizer:
         scores *= lead_bias
 
         return scores
+
+
+# Shared instance: safe because TextSummarizer holds no per-call state
+_summarizer = TextSummarizer()
+
+
+def summarize_text(text: str, **kwargs) -> str:
+    """
+    Picklable entry point for the process pool (see app.core.workers).
+    Accepts the same keyword arguments as TextSummarizer.summarize and
+    uses the corpus IDF model when this process has one that is ready.
+    """
+    kwargs.setdefault("idf_model", get_idf_model())
+    return _summarizer.summarize(text, **kwargs)
@@ -0,0 +1,283 @@
+"""
+Article summary pipeline shared by the summary route and ingestion.
+Scrape → GNews content fallback → NLP summary → description → placeholder.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from app.core.cache import get_from_cache, set_in_cache
+from app.core.config import settings
+from app.core.singleflight import SingleFlight, acquire_lock, lock_held, release_lock
+from app.core.workers import WorkerQueueFull, run_cpu_bound
+from app.services.domain_health import DomainHealth
+from app.services.summarizer import summarize_text
+from app.services.summary_store import SummaryStore, content_hash
+from app.services.text_utils import extract_article_text
+from app.services.url_utils import article_id_for, domain_of
+
+logger = logging.getLogger(__name__)
+
+# Parameters of generated summaries; stored alongside them in the summary store
+SUMMARY_PARAMS = {
+    "min_words": 100,
+    "max_words": 120,
+    "selection": "greedy",
+}
+
+# Below this much text there is nothing worth summarizing
+MIN_ARTICLE_WORDS = 200
+
+PLACEHOLDER_SUMMARY = (
+    "This article could not be summarized due to publisher restrictions. "
+    "Please open the full article to read more."
+)
+
+
+def summary_cache_key(url: str) -> str:
+    """Keyed by canonical article id so URL variants of one story share a summary"""
+    return "summary:" + article_id_for(url)
+
+
+async def build_summary(
+    url: str,
+    content: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Dict:
+    """
+    Summary rules:
+    - News card → description (frontend)
+    - AI summary → NLP ONLY
+    - Paywall / failure → fallback to same description
+    """
+    article_text = None
+    summary = None
+    source = "generated"
+    # Set when our own worker pool was full: the result is worse than usual but not final
+    transient = False
+
+    # --------------------------------------------------
+    # 1️⃣ Prefer full article text (scrape)
+    # --------------------------------------------------
+    # Known-failing publishers (paywalls, bot blocks) skip straight to the fallback
+    domain = domain_of(url)
+    if await DomainHealth.should_skip(domain):
+        logger.debug(f"[SCRAPE SKIP] {domain} | {url}")
+    else:
+        start = time.perf_counter()
+        try:
+            article_text = await extract_article_text(url)
+        except WorkerQueueFull:
+            # Our capacity, not the publisher's fault: don't count against the domain
+            article_text = None
+            transient = True
+        except Exception as e:
+            article_text = None
+            await DomainHealth.record(domain, False, (time.perf_counter() - start) * 1000, error=str(e))
+        else:
+            # Teaser-length text (soft paywall) is as useless as a failed fetch
+            words = len(article_text.split()) if article_text else 0
+            await DomainHealth.record(
+                domain,
+                words >= MIN_ARTICLE_WORDS,
+                (time.perf_counter() - start) * 1000,
+                chars=len(article_text or ""),
+                error=None if words >= MIN_ARTICLE_WORDS else f"only {words} words extracted",
+            )
+
+    # --------------------------------------------------
+    # 2️⃣ Fallback to GNews content
+    # --------------------------------------------------
+    if not article_text and content:
+        article_text = content
+
+    # --------------------------------------------------
+    # 3️⃣ NLP summary ONLY if enough text
+    # --------------------------------------------------
+    if article_text and len(article_text.split()) >= MIN_ARTICLE_WORDS:
+        # Same text + same summarizer version/params → reuse the stored summary
+        text_hash = content_hash(article_text)
+        summary = await SummaryStore.get(text_hash, SUMMARY_PARAMS)
+
+        if not summary:
+            try:
+                # CPU-bound TF-IDF runs in the process pool, off the event loop
+                summary = await run_cpu_bound(
+                    summarize_text,
+                    article_text,
+                    **SUMMARY_PARAMS
+                )
+            except WorkerQueueFull:
+                summary = None
+                transient = True
+            except Exception:
+                summary = None
+
+            if summary:
+                await SummaryStore.save(text_hash, article_id_for(url), SUMMARY_PARAMS, summary)
+
+    # --------------------------------------------------
+    # 4️⃣ PAYWALL / FAILURE → USE DESCRIPTION
+    # --------------------------------------------------
+    if not summary and description:
+        summary = description.strip()
+        source = "description"
+
+    # --------------------------------------------------
+    # 5️⃣ LAST RESORT
+    # --------------------------------------------------
+    if not summary:
+        summary = PLACEHOLDER_SUMMARY
+        source = "placeholder"
+
+    response = {
+        "summary": summary,
+        "source": source,
+        "is_fallback": source != "generated",
+    }
+    if transient:
+        response["transient"] = True
+    return response
+
+
+# --------------------------------------------------
+# SINGLE-FLIGHT GENERATION
+# --------------------------------------------------
+# One scrape-and-summarize per article: coalesced in-process, locked across instances
+_flight = SingleFlight()
+
+LOCK_POLL_INTERVAL = 0.2
+
+
+async def _wait_for_cached(cache_key: str, lock_key: str, timeout: float) -> Optional[Dict]:
+    """
+    Poll the cache while another instance holds the lock. Stops as soon as
+    the lock is gone: the holder finished without caching anything
+    (placeholder, transient fallback) or failed.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        held = await lock_held(lock_key)
+        cached = await get_from_cache(cache_key)
+        if cached or not held:
+            return cached
+    return None
+
+
+async def _generate_once(url: str, content: Optional[str], description: Optional[str]) -> Dict:
+    cache_key = summary_cache_key(url)
+    lock_key = f"lock:{cache_key}"
+
+    token = await acquire_lock(lock_key, settings.SUMMARY_LOCK_TTL)
+    if token is None:
+        # Another instance is generating it: wait for its result
+        cached = await _wait_for_cached(cache_key, lock_key, settings.SUMMARY_LOCK_TTL)
+        if cached:
+            return cached
+        # Nothing cached by the holder: generate, under the lock if it is free again
+        token = await acquire_lock(lock_key, settings.SUMMARY_LOCK_TTL)
+        if token is None:
+            logger.warning(f"[SUMMARY LOCK] lock still held after waiting; generating | {url}")
+
+    try:
+        # The previous holder may have finished between our cache miss and the lock
+        cached = await get_from_cache(cache_key)
+        if cached:
+            return cached
+
+        response = await build_summary(url, content, description)
+        transient = response.pop("transient", False)
+        # Never cache the placeholder (a later caller may have a description to
+        # fall back on) or a fallback forced by a momentarily full worker pool
+        if response["source"] != "placeholder" and not transient:
+            await set_in_cache(cache_key, response)
+        return response
+    finally:
+        if token:
+            await release_lock(lock_key, token)
+
+
+async def get_or_build_summary(
+    url: str,
+    content: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Tuple[Dict, bool]:
+    """
+    Cached summary, or generate it exactly once no matter how many callers
+    ask concurrently. Returns (response, was_cached).
+    """
+    cache_key = summary_cache_key(url)
+
+    cached = await get_from_cache(cache_key)
+    if cached:
+        return cached, True
+
+    response = await _flight.do(cache_key, lambda: _generate_once(url, content, description))
+    return response, False
+
+
+# --------------------------------------------------
+# INGESTION-TIME PRECOMPUTE (BACKGROUND)
+# --------------------------------------------------
+_semaphore: Optional[asyncio.Semaphore] = None
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.SUMMARY_PRECOMPUTE_CONCURRENCY)
+    return _semaphore
+
+
+async def _precompute_one(article: Dict):
+    url = article.get("url")
+    if not url:
+        return
+
+    async with _get_semaphore():
+        # Shares the single flight with readers: a click during precompute just waits for it
+        try:
+            response, was_cached = await get_or_build_summary(
+                url, article.get("content"), article.get("description")
+            )
+        except Exception as e:
+            logger.warning(f"[SUMMARY PRECOMPUTE] failed {url}: {e}")
+            return
+
+        if not was_cached:
+            logger.debug(f"[SUMMARY PRECOMPUTE] {response['source']} | {url}")
+
+
+def schedule_summaries(articles: Iterable[Dict]) -> int:
+    """
+    Summarize articles in the background with bounded concurrency so that
+    summary requests for fresh stories are cache hits. Returns tasks scheduled.
+    """
+    if not settings.SUMMARY_PRECOMPUTE:
+        return 0
+
+    scheduled = 0
+    for article in articles:
+        task = asyncio.create_task(_precompute_one(article))
+        # Keep a reference so the task is not garbage-collected mid-flight
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        scheduled += 1
+
+    if scheduled:
+        logger.info(f"[SUMMARY PRECOMPUTE] scheduled={scheduled} | in_flight={len(_background_tasks)}")
+    return scheduled
+
+
+async def cancel_precompute():
+    """Cancel outstanding background summaries. Called during shutdown."""
+    tasks = list(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
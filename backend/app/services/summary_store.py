@@ -0,0 +1,73 @@
+"""
+Durable summary store.
+Generated summaries are persisted in MongoDB keyed by a hash of the extracted
+article text, together with the summarizer version and parameters that
+produced them. Redis stays in front as the hot layer; a summary is only
+recomputed when the text hash, the summarizer version or the parameters change.
+"""
+
+import hashlib
+import logging
+import re
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.core.database import MongoDB
+from app.services.summarizer import SUMMARIZER_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """Whitespace-insensitive sha256 of extracted article text."""
+    normalized = re.sub(r"\s+", " ", text or "").strip()
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class SummaryStore:
+    """MongoDB-backed store of generated summaries (best-effort)."""
+
+    COLLECTION = "summaries"
+
+    @staticmethod
+    def _collection():
+        return MongoDB.get_database()[SummaryStore.COLLECTION]
+
+    @staticmethod
+    async def get(text_hash: str, params: Dict) -> Optional[str]:
+        """Stored summary for this text, if produced by the current summarizer and params."""
+        try:
+            doc = await SummaryStore._collection().find_one(
+                {
+                    "_id": text_hash,
+                    "summarizer_version": SUMMARIZER_VERSION,
+                    "params": params,
+                },
+                projection={"summary": 1},
+            )
+        except Exception as e:
+            logger.error(f"[SUMMARY STORE ERROR] get {text_hash[:12]}: {e}")
+            return None
+        return doc.get("summary") if doc else None
+
+    @staticmethod
+    async def save(text_hash: str, article_id: str, params: Dict, summary: str):
+        """Upsert a summary; replaces results from older versions or params."""
+        now = datetime.utcnow()
+        try:
+            await SummaryStore._collection().update_one(
+                {"_id": text_hash},
+                {
+                    "$set": {
+                        "summary": summary,
+                        "summarizer_version": SUMMARIZER_VERSION,
+                        "params": params,
+                        "updated_at": now,
+                    },
+                    "$setOnInsert": {"created_at": now},
+                    "$addToSet": {"article_ids": article_id},
+                },
+                upsert=True,
+            )
+        except Exception as e:
+            logger.error(f"[SUMMARY STORE ERROR] save {text_hash[:12]}: {e}")
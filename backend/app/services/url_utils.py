@@ -0,0 +1,124 @@
+"""
+Canonical URL normalization.
+The same story is often linked with tracking params, fragments or as an AMP
+variant. Everything that identifies an article (archive _id, sentiment and
+summary cache keys) is derived from the canonical form instead of the raw URL.
+"""
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query params that never change the document being served: only well-known
+# tracking keys. Generic names (ref, amp, ...) select content on some sites.
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "ocid",
+    "cmpid",
+    "ref_src",
+    "spm",
+    "_ga",
+    "_gl",
+    "at_medium",
+    "at_campaign",
+}
+TRACKING_PREFIXES = ("utm_", "pk_")
+
+# Host prefixes that serve the same article as the bare domain
+HOST_PREFIXES = ("www.", "m.", "amp.", "mobile.")
+
+AMP_CACHE_HOST = re.compile(r"\.cdn\.ampproject\.org$", re.I)
+AMP_PATH_SUFFIX = re.compile(r"(/amp|\.amp|/amp\.html)$", re.I)
+AMP_PATH_PREFIX = re.compile(r"^/amp(?=/)", re.I)
+
+
+def _unwrap_amp_cache(scheme: str, netloc: str, path: str):
+    """Turn https://x.cdn.ampproject.org/c/s/host/path into https://host/path."""
+    if not AMP_CACHE_HOST.search(netloc):
+        return scheme, netloc, path
+
+    parts = path.lstrip("/").split("/")
+    # /c/s/<host>/... (https) or /c/<host>/... (http); /v/ is the viewer variant
+    if parts and parts[0] in ("c", "v", "i"):
+        parts = parts[1:]
+        if parts and parts[0] == "s":
+            parts = parts[1:]
+    if not parts or not parts[0]:
+        return scheme, netloc, path
+
+    return "https", parts[0], "/" + "/".join(parts[1:])
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize an article URL to its canonical form:
+    - unwrap Google AMP cache URLs and strip AMP path variants
+    - lowercase scheme/host, drop www./m./amp. prefixes and default ports
+    - drop fragments and tracking params (utm_*, fbclid, ...), sort the rest
+    - drop trailing slashes
+    Unparseable input is returned stripped but otherwise unchanged.
+    """
+    url = (url or "").strip()
+    if not url:
+        return url
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    if not parts.netloc:
+        return url
+
+    scheme, netloc, path = _unwrap_amp_cache(parts.scheme.lower(), parts.netloc.lower(), parts.path)
+
+    # http and https serve the same story
+    if scheme in ("http", "https"):
+        scheme = "https"
+
+    # Drop credentials and default ports
+    netloc = netloc.rsplit("@", 1)[-1]
+    if netloc.endswith(":80") or netloc.endswith(":443"):
+        netloc = netloc.rsplit(":", 1)[0]
+    for prefix in HOST_PREFIXES:
+        if netloc.startswith(prefix):
+            netloc = netloc[len(prefix):]
+            break
+
+    path = re.sub(r"/{2,}", "/", path or "/")
+    path = AMP_PATH_PREFIX.sub("", path)
+    path = AMP_PATH_SUFFIX.sub("", path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+    if not path:
+        path = "/"
+
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    ]
+    query.sort()
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def article_id_for(url: str) -> str:
+    """Stable article identity: md5 of the canonical URL."""
+    return hashlib.md5(canonicalize_url(url).encode()).hexdigest()
+
+
+def domain_of(url: str) -> str:
+    """Publisher host of an article URL (canonical form, so www./amp. variants match)."""
+    return urlsplit(canonicalize_url(url)).hostname or ""
@@ -0,0 +1,312 @@
+"""
+Materialized per-user profile counters.
+One `user_stats` document per user (_id = user_id) holds everything the
+profile endpoints show, so reading them is a single point lookup:
+
+    {bookmarks, read_later, articles_read, comments,
+     categories: {category: n}, sentiment: {label: n},
+     daily: {"YYYY-MM-DD": n}, last_active_at}
+
+Write paths apply atomic $inc updates, each bumping the document's
+`version`. A periodic reconciliation job rebuilds documents from the
+source collections, repairing any drift (a failed counter update) and
+pruning old days. A rebuild is only written if the version is unchanged
+since it started, so it never overwrites a concurrent counter update.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.core.database import MongoDB
+from app.services.profile_analytics import ProfileCache, aggregate_saved_items
+
+logger = logging.getLogger(__name__)
+
+# Daily activity buckets older than this are dropped on reconciliation
+DAILY_RETENTION_DAYS = 30
+
+COUNTERS = ("bookmarks", "read_later", "articles_read", "comments")
+
+# Attempts at writing a rebuild before giving up until the next run
+RECONCILE_RETRIES = 3
+
+# One background reconcile per user at a time
+_reconcile_tasks: Dict[str, asyncio.Task] = {}
+
+
+def _field_key(value: str) -> str:
+    """Category/label values become sub-document keys: no dots or leading $."""
+    return str(value).replace(".", "_").lstrip("$")
+
+
+def _day_key(created_at: Optional[datetime]) -> Optional[str]:
+    if not isinstance(created_at, datetime):
+        return None
+    return created_at.strftime("%Y-%m-%d")
+
+
+def _retention_start() -> date:
+    return datetime.utcnow().date() - timedelta(days=DAILY_RETENTION_DAYS - 1)
+
+
+def _item_increments(kind: str, item: Dict, delta: int) -> Dict[str, int]:
+    """
+    Counter updates for adding (delta=1) or removing (delta=-1) a saved item.
+    kind is the item's collection, "bookmarks" or "read_later".
+    """
+    inc = {kind: delta}
+
+    category = item.get("category")
+    if category:
+        inc[f"categories.{_field_key(category)}"] = delta
+
+    sentiment = item.get("sentiment")
+    if isinstance(sentiment, dict) and sentiment.get("label"):
+        inc[f"sentiment.{_field_key(sentiment['label'])}"] = delta
+
+    created_at = item.get("created_at")
+    day = _day_key(created_at)
+    # Removing an item from a pruned day must not resurrect its bucket as negative
+    if day and (delta > 0 or created_at.date() >= _retention_start()):
+        inc[f"daily.{day}"] = delta
+
+    return inc
+
+
+def _sum_increments(kind: str, items: List[Dict], delta: int) -> Dict[str, int]:
+    inc: Dict[str, int] = {}
+    for item in items:
+        for field, value in _item_increments(kind, item, delta).items():
+            inc[field] = inc.get(field, 0) + value
+    return inc
+
+
+class UserStats:
+    """
+    Best-effort counter maintenance: failures are logged and never break the
+    write path that triggered them (reconciliation repairs the drift).
+    """
+
+    COLLECTION = "user_stats"
+
+    @staticmethod
+    def _collection():
+        return MongoDB.get_database()[UserStats.COLLECTION]
+
+    @staticmethod
+    async def _apply(user_id: str, inc: Dict[str, int], **extra):
+        update = {"$inc": {**inc, "version": 1}, "$set": {"updated_at": datetime.utcnow()}}
+        if extra.get("last_active_at"):
+            update["$max"] = {"last_active_at": extra["last_active_at"]}
+        try:
+            await UserStats._collection().update_one({"_id": user_id}, update, upsert=True)
+        except Exception as e:
+            logger.warning(f"[USER STATS] update failed for {user_id}: {e}")
+
+    # --------------------------------------------------
+    # WRITE PATHS
+    # --------------------------------------------------
+    # Writes that change analytics numbers also drop the cached analytics response
+    @staticmethod
+    async def record_saved(user_id: str, kind: str, item: Dict):
+        """A bookmark / read-later item was inserted."""
+        await UserStats.record_saved_many(user_id, kind, [item])
+
+    @staticmethod
+    async def record_unsaved(user_id: str, kind: str, item: Dict):
+        """A bookmark / read-later item was deleted (item is the deleted document)."""
+        await UserStats.record_unsaved_many(user_id, kind, [item])
+
+    @staticmethod
+    async def record_saved_many(user_id: str, kind: str, items: List[Dict]):
+        """Bulk insert: all increments folded into one update."""
+        dates = [item["created_at"] for item in items if isinstance(item.get("created_at"), datetime)]
+        await UserStats._apply(
+            user_id,
+            _sum_increments(kind, items, 1),
+            last_active_at=max(dates) if dates else None,
+        )
+        await ProfileCache.invalidate(user_id)
+
+    @staticmethod
+    async def record_unsaved_many(user_id: str, kind: str, items: List[Dict]):
+        await UserStats._apply(user_id, _sum_increments(kind, items, -1))
+        await ProfileCache.invalidate(user_id)
+
+    @staticmethod
+    async def record_summary_read(user_id: str):
+        await UserStats._apply(user_id, {"articles_read": 1})
+        await ProfileCache.invalidate(user_id)
+
+    @staticmethod
+    async def record_comment(user_id: str, delta: int = 1):
+        await UserStats._apply(user_id, {"comments": delta})
+
+    # --------------------------------------------------
+    # READS
+    # --------------------------------------------------
+    @staticmethod
+    async def get(user_id: str) -> Dict:
+        """
+        The user's stats document. Users without a reconciled document
+        (predating the counters) get numbers computed from the source
+        collections, without writing; the document itself is rebuilt by a
+        background reconcile.
+        """
+        try:
+            doc = await UserStats._collection().find_one({"_id": user_id})
+        except Exception as e:
+            logger.warning(f"[USER STATS] read failed for {user_id}: {e}")
+            doc = None
+
+        if doc is None or "reconciled_at" not in doc:
+            doc = await UserStats._rebuild(user_id)
+            UserStats._schedule_reconcile(user_id)
+
+        for counter in COUNTERS:
+            doc[counter] = max(int(doc.get(counter, 0)), 0)
+        return doc
+
+    @staticmethod
+    def daily_buckets(doc: Dict) -> Dict[date, int]:
+        """daily sub-document keyed by date, for build_analytics."""
+        buckets = {}
+        for day, count in (doc.get("daily") or {}).items():
+            try:
+                buckets[datetime.strptime(day, "%Y-%m-%d").date()] = int(count)
+            except ValueError:
+                continue
+        return buckets
+
+    # --------------------------------------------------
+    # RECONCILIATION
+    # --------------------------------------------------
+    @staticmethod
+    async def _rebuild(user_id: str) -> Dict:
+        """Stats fields computed from bookmarks, read_later, summary_logs and comments."""
+        db = MongoDB.get_database()
+        since = datetime.combine(_retention_start(), datetime.min.time())
+
+        saved, articles_read, comments = await asyncio.gather(
+            aggregate_saved_items(db, user_id, since),
+            db.summary_logs.count_documents({"user_id": user_id}),
+            db.comments.count_documents({"user_id": user_id}),
+        )
+
+        return {
+            "bookmarks": saved["bookmarks"],
+            "read_later": saved["read_later"],
+            "articles_read": articles_read,
+            "comments": comments,
+            "categories": {_field_key(k): v for k, v in saved["categories"].items()},
+            "sentiment": {_field_key(k): v for k, v in saved["sentiment"].items()},
+            "daily": {day.strftime("%Y-%m-%d"): count for day, count in saved["daily"].items()},
+            "last_active_at": saved["last_active_at"],
+        }
+
+    @staticmethod
+    async def reconcile(user_id: str) -> Optional[Dict]:
+        """
+        Rebuild one user's document. The version is read before the source
+        collections, and the rebuild is applied with a $set conditioned on
+        it: if a counter update landed meanwhile the rebuild is redone.
+        Returns the new document, or None if every attempt conflicted.
+
+        The cached analytics response is only dropped if the rebuild changed
+        the numbers; otherwise every run (and the background reconcile after
+        a first profile visit) would throw away correct cache entries.
+        """
+        collection = UserStats._collection()
+        for _ in range(RECONCILE_RETRIES):
+            current = await collection.find_one({"_id": user_id})
+            fields = await UserStats._rebuild(user_id)
+            changed = current is not None and any(current.get(k) != v for k, v in fields.items())
+            now = datetime.utcnow()
+            fields.update(updated_at=now, reconciled_at=now)
+
+            try:
+                if current is None:
+                    await collection.insert_one({"_id": user_id, "version": 0, **fields})
+                else:
+                    # A missing version (documents predating it) matches null
+                    result = await collection.update_one(
+                        {"_id": user_id, "version": current.get("version")},
+                        {"$set": fields, "$inc": {"version": 1}},
+                    )
+                    if result.matched_count == 0:
+                        continue
+            except DuplicateKeyError:
+                # A counter update created the document first
+                continue
+
+            if changed:
+                await ProfileCache.invalidate(user_id)
+            return {"_id": user_id, **fields}
+
+        logger.warning(f"[USER STATS] reconcile of {user_id} kept conflicting, left for the next run")
+        return None
+
+    @staticmethod
+    async def _reconcile_quietly(user_id: str):
+        try:
+            await UserStats.reconcile(user_id)
+        except Exception as e:
+            logger.warning(f"[USER STATS] reconcile failed for {user_id}: {e}")
+
+    @staticmethod
+    def _schedule_reconcile(user_id: str):
+        if user_id in _reconcile_tasks:
+            return
+        task = asyncio.create_task(UserStats._reconcile_quietly(user_id))
+        # Keep a reference so the task is not garbage-collected mid-flight
+        _reconcile_tasks[user_id] = task
+        task.add_done_callback(lambda _: _reconcile_tasks.pop(user_id, None))
+
+    @staticmethod
+    async def reconcile_all(only_missing: bool = False) -> int:
+        """
+        Rebuild stats for every user with activity, or with only_missing,
+        just those without a reconciled document. Returns users reconciled.
+        """
+        db = MongoDB.get_database()
+        user_ids = set(await db.user_stats.distinct("_id"))
+        for collection in (db.bookmarks, db.read_later, db.summary_logs, db.comments):
+            user_ids.update(await collection.distinct("user_id"))
+        user_ids.discard(None)
+        if only_missing:
+            user_ids -= set(await db.user_stats.distinct("_id", {"reconciled_at": {"$exists": True}}))
+
+        reconciled = 0
+        for user_id in user_ids:
+            try:
+                if await UserStats.reconcile(user_id):
+                    reconciled += 1
+            except Exception as e:
+                logger.warning(f"[USER STATS] reconcile failed for {user_id}: {e}")
+        logger.info(f"[USER STATS] reconciled {reconciled}/{len(user_ids)} users")
+        return reconciled
+
+
+async def run_reconciliation(interval: Optional[int] = None):
+    """
+    Background job: first backfill users without a stats document, then
+    rebuild all user stats every USER_STATS_RECONCILE_INTERVAL seconds.
+    """
+    interval = interval or settings.USER_STATS_RECONCILE_INTERVAL
+    if interval <= 0:
+        return
+    try:
+        await UserStats.reconcile_all(only_missing=True)
+    except Exception as e:
+        logger.error(f"[USER STATS] backfill run failed: {e}")
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await UserStats.reconcile_all()
+        except Exception as e:
+            logger.error(f"[USER STATS] reconciliation run failed: {e}")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark article text extraction on the saved HTML corpus.
+Measures per-page parse+extract time of the lxml extractor and, when
+BeautifulSoup is installed, the previous html.parser implementation.
+
+Usage (from backend/):
+    python benchmarks/bench_extraction.py --repeat 20
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.text_utils import parse_article_html  # noqa: E402
+
+CORPUS_DIR = Path(__file__).parent / "html_corpus"
+
+
+def legacy_extract(page: str) -> str:
+    """Previous BeautifulSoup(html.parser) implementation, for comparison."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page, "html.parser")
+    for tag in soup(["script", "style", "nav", "footer", "header", "aside", "noscript"]):
+        tag.decompose()
+    paragraphs = soup.find_all("p")
+    if not paragraphs:
+        paragraphs = soup.find_all("div", {"class": re.compile(r"(content|article|post|story|text)", re.I)})
+    if not paragraphs:
+        text = soup.get_text()
+    else:
+        text = " ".join(p.get_text() for p in paragraphs)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def time_it(fn, page: str, repeat: int):
+    timings = []
+    result = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(page)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML extraction benchmark")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--corpus", default=str(CORPUS_DIR))
+    args = parser.parse_args()
+
+    pages = {path.name: path.read_text(encoding="utf-8") for path in sorted(Path(args.corpus).glob("*.html"))}
+    # Worst case the fetch cap allows: ~2 MB page
+    heavy = pages.get("heavy_live_blog.html")
+    if heavy and "<main>" in heavy:
+        head, rest = heavy.split("<main>", 1)
+        main_block, tail = rest.split("</main>", 1)
+        pages["synthetic_2mb.html"] = head + ("<main>" + main_block + "</main>") * 9 + tail
+
+    try:
+        import bs4  # noqa: F401
+        has_legacy = True
+    except ImportError:
+        has_legacy = False
+        print("(beautifulsoup4 not installed: legacy column skipped)\n")
+
+    print(f"{'page':<24} {'KB':>7} {'lxml ms':>9} {'bs4 ms':>9} {'speedup':>8} {'chars':>8} {'same':>5}")
+    for name, page in pages.items():
+        lxml_ms, text = time_it(parse_article_html, page, args.repeat)
+        row = f"{name:<24} {len(page.encode()) / 1024:>7.0f} {lxml_ms:>9.2f}"
+        if has_legacy:
+            legacy_ms, legacy_text = time_it(legacy_extract, page, max(1, args.repeat // 2))
+            row += f" {legacy_ms:>9.2f} {legacy_ms / lxml_ms:>7.1f}x {len(text):>8} {str(text == legacy_text):>5}"
+        else:
+            row += f" {'-':>9} {'-':>8} {len(text):>8} {'-':>5}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark /profile/analytics against a user with many saved items.
+Seeds a throwaway database with bookmarks, read-later items and summary
+logs, then compares the previous implementation (sequential counts, finds,
+per-collection aggregations and Python-side bucketing) with the single
+$unionWith/$facet aggregation. Needs MongoDB 5.0+ ($dateTrunc).
+
+Usage (from backend/):
+    python benchmarks/bench_profile_analytics.py --uri mongodb://localhost:27017 --items 10000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.profile_analytics import compute_profile_analytics  # noqa: E402
+
+CATEGORIES = ["general", "business", "technology", "sports", "science", "health", "entertainment"]
+SENTIMENTS = ["Positive", "Neutral", "Negative"]
+USER_ID = "bench_user"
+
+
+async def legacy_analytics(db, user_id: str) -> dict:
+    """Previous implementation: ~10 sequential round trips."""
+    bookmarks_count = await db.bookmarks.count_documents({"user_id": user_id})
+    read_later_count = await db.read_later.count_documents({"user_id": user_id})
+    articles_read = await db.summary_logs.count_documents({"user_id": user_id})
+
+    last_active_at = None
+    for collection in (db.bookmarks, db.read_later):
+        latest = await collection.find_one(
+            {"user_id": user_id}, sort=[("created_at", -1)], projection={"created_at": 1}
+        )
+        if latest and latest.get("created_at"):
+            if not last_active_at or latest["created_at"] > last_active_at:
+                last_active_at = latest["created_at"]
+
+    category_counts = {}
+    for collection in (db.bookmarks, db.read_later):
+        pipeline = [
+            {"$match": {"user_id": user_id, "category": {"$exists": True, "$ne": None}}},
+            {"$group": {"_id": "$category", "count": {"$sum": 1}}},
+        ]
+        async for row in collection.aggregate(pipeline):
+            if row.get("_id"):
+                category_counts[row["_id"]] = category_counts.get(row["_id"], 0) + row["count"]
+
+    start_date = datetime.utcnow() - timedelta(days=6)
+    weekly_counts = {}
+    for collection in (db.bookmarks, db.read_later):
+        async for row in collection.find(
+            {"user_id": user_id, "created_at": {"$gte": start_date}}, projection={"created_at": 1}
+        ):
+            day = row["created_at"].strftime("%a")
+            weekly_counts[day] = weekly_counts.get(day, 0) + 1
+
+    sentiment_counts = {label: 0 for label in SENTIMENTS}
+    for collection in (db.bookmarks, db.read_later):
+        async for row in collection.find(
+            {"user_id": user_id, "sentiment": {"$exists": True}}, projection={"sentiment": 1}
+        ):
+            label = (row.get("sentiment") or {}).get("label")
+            if label in sentiment_counts:
+                sentiment_counts[label] += 1
+
+    return {
+        "bookmarks": bookmarks_count,
+        "read_later": read_later_count,
+        "articles_read": articles_read,
+        "last_active_at": last_active_at,
+        "categories": category_counts,
+        "weekly": weekly_counts,
+        "sentiment": sentiment_counts,
+    }
+
+
+def make_items(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    for i in range(count):
+        item = {
+            "user_id": USER_ID,
+            "article_id": f"article-{i}",
+            "title": f"Benchmark article {i}",
+            "url": f"https://example.com/news/{i}",
+            "category": rng.choice(CATEGORIES),
+            "created_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 90)),
+        }
+        if rng.random() < 0.8:
+            item["sentiment"] = {"label": rng.choice(SENTIMENTS), "score": round(rng.random(), 3)}
+        yield item
+
+
+async def seed(db, items: int):
+    await db.client.drop_database(db.name)
+    for collection in (db.bookmarks, db.read_later, db.summary_logs):
+        await collection.create_index([("user_id", 1), ("created_at", -1)])
+
+    all_items = list(make_items(items))
+    half = len(all_items) // 2
+    await db.bookmarks.insert_many(all_items[:half])
+    await db.read_later.insert_many(all_items[half:])
+    await db.summary_logs.insert_many(
+        {"user_id": USER_ID, "url": item["url"], "source": "generated", "created_at": item["created_at"]}
+        for item in all_items[: items // 2]
+    )
+
+    # Noise from other users so the user_id index actually matters
+    await db.bookmarks.insert_many(
+        {**item, "user_id": f"other-{i % 50}"} for i, item in enumerate(make_items(items, seed=3))
+    )
+
+
+async def time_it(fn, repeat: int):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Profile analytics benchmark")
+    parser.add_argument("--uri", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="newsag_bench")
+    parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded database")
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(args.uri)
+    db = client[args.db]
+
+    print(f"{'items':>7} {'legacy ms':>10} {'facet ms':>9} {'speedup':>8} {'same':>5}")
+    try:
+        for items in args.items:
+            await seed(db, items)
+            legacy_ms, legacy = await time_it(lambda: legacy_analytics(db, USER_ID), args.repeat)
+            facet_ms, current = await time_it(lambda: compute_profile_analytics(db, USER_ID), args.repeat)
+
+            tier1 = current["tier1"]
+            same = (
+                tier1["bookmarks"] == legacy["bookmarks"]
+                and tier1["read_later"] == legacy["read_later"]
+                and tier1["articles_read"] == legacy["articles_read"]
+                and {row["category"]: row["count"] for row in current["tier2"]["category_breakdown"]}
+                == legacy["categories"]
+                and current["tier3"]["sentiment_breakdown"] == legacy["sentiment"]
+            )
+            print(f"{items:>7} {legacy_ms:>10.1f} {facet_ms:>9.1f} {legacy_ms / facet_ms:>7.1f}x {str(same):>5}")
+    finally:
+        if not args.keep:
+            await client.drop_database(args.db)
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
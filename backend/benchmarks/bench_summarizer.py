@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark TextSummarizer selection modes on long articles.
+Compares the greedy word-overlap loop against MMR selection for speed and
+quality (redundancy between picked sentences, coverage of the document).
+
+Usage (from backend/):
+    python benchmarks/bench_summarizer.py --words 5000 10000 20000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.summarizer import TextSummarizer  # noqa: E402
+
+TOPICS = {
+    "economy": "inflation rates central bank policy markets investors growth budget deficit tax revenue exports",
+    "election": "voters candidates campaign polling parliament coalition ballots turnout constituency results",
+    "climate": "emissions monsoon rainfall temperatures drought farmers crops renewable energy heatwave",
+    "sports": "captain innings wickets tournament coach squad injury final stadium championship",
+}
+FILLER = "officials said on Tuesday that the situation was being closely monitored by several agencies"
+
+
+def make_article(words: int, seed: int = 7) -> str:
+    """
+    Deterministic synthetic news article with topical sections, near-duplicate
+    sentences (wire copy repeated by editors) and boilerplate filler.
+    """
+    rng = random.Random(seed)
+    sentences = []
+    total = 0
+    topics = list(TOPICS.items())
+
+    while total < words:
+        name, vocab = topics[(len(sentences) // 25) % len(topics)]
+        terms = vocab.split()
+        body = " ".join(rng.choice(terms) for _ in range(rng.randint(10, 18)))
+        sentence = f"In {name} news, {body} according to {FILLER}."
+        if sentences and rng.random() < 0.15:
+            # Near-duplicate of a recent sentence
+            sentence = sentences[-rng.randint(1, min(5, len(sentences)))].replace("according to", "reported by")
+        sentences.append(sentence[0].upper() + sentence[1:])
+        total += len(sentence.split())
+
+    return " ".join(sentences)
+
+
+def quality(summarizer: TextSummarizer, article: str, summary: str) -> tuple:
+    """(redundancy, coverage) using the article's own TF-IDF space."""
+    doc_sentences = summarizer._split_sentences(article)
+    picked = summarizer._split_sentences(summary.rstrip("…"))
+    vectorizer = summarizer._build_vectorizer().fit(doc_sentences)
+
+    picked_matrix = vectorizer.transform(picked)
+    similarity = (picked_matrix @ picked_matrix.T).toarray()
+    n = similarity.shape[0]
+    redundancy = (similarity.sum() - n) / (n * (n - 1)) if n > 1 else 0.0
+
+    doc_vector = np.asarray(vectorizer.transform([" ".join(doc_sentences)]).todense()).ravel()
+    sum_vector = np.asarray(vectorizer.transform([summary]).todense()).ravel()
+    denominator = np.linalg.norm(doc_vector) * np.linalg.norm(sum_vector)
+    coverage = float(doc_vector @ sum_vector / denominator) if denominator else 0.0
+
+    return redundancy, coverage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Greedy vs MMR summarizer benchmark")
+    parser.add_argument("--words", type=int, nargs="+", default=[5000, 10000, 20000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--mmr-lambda", type=float, default=0.7)
+    args = parser.parse_args()
+
+    summarizer = TextSummarizer()
+    print(f"{'words':>7} {'mode':>7} {'mean ms':>9} {'best ms':>9} {'redundancy':>11} {'coverage':>9}")
+
+    for words in args.words:
+        article = make_article(words)
+        for mode in TextSummarizer.SELECTION_MODES:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                summary = summarizer.summarize(article, selection=mode, mmr_lambda=args.mmr_lambda)
+                timings.append((time.perf_counter() - start) * 1000)
+
+            redundancy, coverage = quality(summarizer, article, summary)
+            print(
+                f"{words:>7} {mode:>7} {np.mean(timings):>9.1f} {min(timings):>9.1f} "
+                f"{redundancy:>11.3f} {coverage:>9.3f}"
+            )
+
+    print("\nredundancy: mean pairwise cosine of picked sentences (lower is better)")
+    print("coverage:   cosine between summary and full article (higher is better)")
+
+
+if __name__ == "__main__":
+    main()
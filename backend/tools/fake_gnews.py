@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Local GNews stand-in for offline and load testing.
+Serves GNews-shaped `/api/v4/top-headlines` responses with configurable
+latency, error rate and article churn, seeded from recorded fixtures
+(see record_gnews.py) when available and synthetic articles otherwise.
+
+Usage (from backend/):
+    python tools/fake_gnews.py --port 8800 --latency-ms 150 --error-rate 0.02 --churn 0.2
+    GNEWS_BASE_URL=http://127.0.0.1:8800/api/v4 uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "gnews"
+
+
+class FakeConfig:
+    """Runtime knobs, read from env so they also work under `uvicorn tools.fake_gnews:app`."""
+
+    latency_ms: int = int(os.getenv("FAKE_GNEWS_LATENCY_MS", 100))
+    jitter_ms: int = int(os.getenv("FAKE_GNEWS_JITTER_MS", 50))
+    error_rate: float = float(os.getenv("FAKE_GNEWS_ERROR_RATE", 0.0))
+    # Fraction of a feed replaced by brand-new articles on every request
+    churn: float = float(os.getenv("FAKE_GNEWS_CHURN", 0.2))
+    fixtures_dir: Path = Path(os.getenv("FAKE_GNEWS_FIXTURES", FIXTURES_DIR))
+    seed: int = int(os.getenv("FAKE_GNEWS_SEED", 42))
+
+
+config = FakeConfig()
+app = FastAPI(title="Fake GNews", description="Local GNews stand-in for load testing")
+
+_rng = random.Random(config.seed)
+_feeds: Dict[str, List[Dict]] = {}
+_serial = 0
+_stats = {"requests": 0, "errors": 0, "new_articles": 0}
+
+
+def _synthetic_article(category: str, country: str, lang: str) -> Dict:
+    """Build one GNews-shaped article with a unique URL."""
+    global _serial
+    _serial += 1
+    published = datetime.utcnow() - timedelta(minutes=_rng.randint(0, 600))
+    body = " ".join(
+        f"Sentence {i} of synthetic {category} story {_serial} with enough words to be summarized properly."
+        for i in range(12)
+    )
+    return {
+        "title": f"[{country}/{lang}] {category.title()} story #{_serial}",
+        "description": f"Synthetic {category} article {_serial} served by the fake GNews server.",
+        "content": body[:260] + "... [1234 chars]",
+        "url": f"https://news.example.com/{category}/story-{_serial}?utm_source=gnews",
+        "image": f"https://news.example.com/images/{_serial}.jpg",
+        "publishedAt": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "source": {"name": _rng.choice(["Example Times", "Sample Herald", "Test Gazette"]), "url": "https://news.example.com"},
+    }
+
+
+def _load_fixture(category: str, country: str, lang: str) -> List[Dict]:
+    path = config.fixtures_dir / f"{category}_{country}_{lang}.json"
+    if not path.exists():
+        return []
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("articles", [])
+    except (OSError, ValueError):
+        return []
+
+
+def _next_feed(category: str, country: str, lang: str, size: int) -> List[Dict]:
+    """Return the current feed for a locale, applying churn since the last request."""
+    key = f"{category}:{country}:{lang}"
+    feed = _feeds.get(key)
+
+    if feed is None:
+        feed = _load_fixture(category, country, lang)
+        while len(feed) < size:
+            feed.append(_synthetic_article(category, country, lang))
+    else:
+        replaced = sum(1 for _ in range(len(feed)) if _rng.random() < config.churn)
+        fresh = [_synthetic_article(category, country, lang) for _ in range(replaced)]
+        feed = fresh + feed[:len(feed) - replaced]
+        _stats["new_articles"] += replaced
+
+    _feeds[key] = feed
+    return feed[:size]
+
+
+@app.get("/api/v4/top-headlines")
+async def top_headlines(
+    category: str = "general",
+    country: str = "in",
+    lang: str = "en",
+    max_articles: int = Query(10, alias="max"),
+    apikey: str = "",
+):
+    _stats["requests"] += 1
+
+    delay = config.latency_ms + _rng.uniform(-config.jitter_ms, config.jitter_ms)
+    if delay > 0:
+        await asyncio.sleep(delay / 1000)
+
+    if _rng.random() < config.error_rate:
+        _stats["errors"] += 1
+        status = _rng.choice([429, 500, 503])
+        return JSONResponse(status_code=status, content={"errors": [f"Injected fake error {status}"]})
+
+    articles = _next_feed(category, country, lang, max(1, min(max_articles, 100)))
+    return {"totalArticles": len(articles) * 10, "articles": articles}
+
+
+@app.get("/stats")
+async def fake_stats():
+    """Counters for the load-test report."""
+    return {**_stats, "feeds": len(_feeds)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local fake GNews server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency-ms", type=int, default=config.latency_ms)
+    parser.add_argument("--jitter-ms", type=int, default=config.jitter_ms)
+    parser.add_argument("--error-rate", type=float, default=config.error_rate)
+    parser.add_argument("--churn", type=float, default=config.churn)
+    parser.add_argument("--fixtures", default=str(config.fixtures_dir))
+    args = parser.parse_args()
+
+    config.latency_ms = args.latency_ms
+    config.jitter_ms = args.jitter_ms
+    config.error_rate = args.error_rate
+    config.churn = args.churn
+    config.fixtures_dir = Path(args.fixtures)
+
+    import uvicorn
+
+    print(f"[FAKE GNEWS] http://{args.host}:{args.port}/api/v4 | latency={config.latency_ms}ms "
+          f"error_rate={config.error_rate} churn={config.churn}")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Minimal async load generator for the feed and ingestion path.
+Run the backend against fake_gnews.py first so no real quota is spent.
+
+Usage (from backend/):
+    python tools/load_test.py --base-url http://127.0.0.1:8000 --concurrency 50 --duration 30 --refresh-every 5
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+
+CATEGORIES = ["general", "nation", "business", "technology", "sports", "entertainment", "health"]
+
+
+async def reader(client: httpx.AsyncClient, deadline: float, results: dict):
+    """Simulate a user paging through category feeds."""
+    while time.monotonic() < deadline:
+        category = random.choice(CATEGORIES)
+        page = random.choice([1, 1, 1, 2, 3])
+        start = time.perf_counter()
+        try:
+            response = await client.get(f"/api/news/topic/{category}", params={"page": page, "page_size": 10})
+            status = response.status_code
+        except httpx.HTTPError:
+            status = "error"
+        results["feed"].append((time.perf_counter() - start, status))
+
+
+async def refresher(client: httpx.AsyncClient, deadline: float, interval: float, results: dict):
+    """Periodically force ingestion so delta processing is exercised under load."""
+    while time.monotonic() < deadline:
+        await asyncio.sleep(interval)
+        category = random.choice(CATEGORIES)
+        start = time.perf_counter()
+        try:
+            response = await client.post(f"/api/news/refresh/{category}")
+            status = response.status_code
+        except httpx.HTTPError:
+            status = "error"
+        results["refresh"].append((time.perf_counter() - start, status))
+
+
+def report(name: str, samples: list):
+    if not samples:
+        return
+    latencies = sorted(duration * 1000 for duration, _ in samples)
+    statuses = defaultdict(int)
+    for _, status in samples:
+        statuses[status] += 1
+
+    def pct(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+    print(
+        f"{name:<8} n={len(samples):<6} mean={statistics.mean(latencies):7.1f}ms "
+        f"p50={pct(0.5):7.1f}ms p95={pct(0.95):7.1f}ms p99={pct(0.99):7.1f}ms statuses={dict(statuses)}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Load-test the news feed path")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--refresh-every", type=float, default=0, help="seconds between forced refreshes (0 = off)")
+    args = parser.parse_args()
+
+    results = defaultdict(list)
+    deadline = time.monotonic() + args.duration
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=30, limits=limits) as client:
+        tasks = [reader(client, deadline, results) for _ in range(args.concurrency)]
+        if args.refresh_every > 0:
+            tasks.append(refresher(client, deadline, args.refresh_every, results))
+        await asyncio.gather(*tasks)
+
+    print(f"\n📈 {args.concurrency} clients for {args.duration:.0f}s against {args.base_url}")
+    report("feed", results["feed"])
+    report("refresh", results["refresh"])
+    total = len(results["feed"])
+    print(f"throughput: {total / args.duration:.1f} feed req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
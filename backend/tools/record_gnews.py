@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Record real GNews top-headlines responses into fixtures for fake_gnews.py.
+Every category/locale recorded costs ONE real API hit from the daily quota.
+
+Usage (from backend/, with GNEWS_API_KEY in .env):
+    python tools/record_gnews.py --categories general technology --country in --lang en
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.config import settings  # noqa: E402
+from app.services.news_service import ALLOWED_CATEGORIES, MAX_ARTICLES  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "gnews"
+REAL_GNEWS_BASE_URL = "https://gnews.io/api/v4"
+
+
+def record(category: str, country: str, lang: str, out_dir: Path, base_url: str) -> Path:
+    params = {
+        "category": category,
+        "country": country,
+        "lang": lang,
+        "max": MAX_ARTICLES,
+        "apikey": settings.GNEWS_API_KEY,
+    }
+    response = httpx.get(f"{base_url}/top-headlines", params=params, timeout=10)
+    response.raise_for_status()
+
+    data = response.json()
+    data["_recorded"] = {
+        "at": datetime.utcnow().isoformat(),
+        "category": category,
+        "country": country,
+        "lang": lang,
+    }
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{category}_{country}_{lang}.json"
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record GNews responses as fixtures")
+    parser.add_argument("--categories", nargs="+", default=["general"], choices=ALLOWED_CATEGORIES)
+    parser.add_argument("--country", default="in")
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--out", default=str(FIXTURES_DIR))
+    # Never record from the fake server by accident, even if GNEWS_BASE_URL points at it
+    parser.add_argument("--base-url", default=REAL_GNEWS_BASE_URL)
+    args = parser.parse_args()
+
+    if not settings.GNEWS_API_KEY:
+        print("❌ GNEWS_API_KEY is not set")
+        sys.exit(1)
+
+    print(f"⚠️  Recording {len(args.categories)} feed(s) uses {len(args.categories)} real GNews hit(s)")
+    for category in args.categories:
+        try:
+            path = record(category, args.country, args.lang, Path(args.out), args.base_url)
+            print(f"✅ {category} -> {path}")
+        except Exception as e:
+            print(f"❌ {category}: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,17 +15,21 @@ export const CommentSection: React.FC<CommentSectionProps> = ({ articleId, artic
   const [newComment, setNewComment] = useState('');
   const [isSubmitting, setIsSubmitting] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchComments = async () => {
       setIsLoading(true);
       setError(null);
       try {
-        const data = await userService.getComments(articleId);
-        setComments(data);
+        const page = await userService.getComments(articleId);
+        setComments(page.comments);
+        setNextCursor(page.nextCursor);
       } catch (err: any) {
         setError(err.message || 'Failed to load comments');
         setComments([]);
+        setNextCursor(null);
       } finally {
         setIsLoading(false);
       }
@@ -33,6 +37,25 @@ export const CommentSection: React.FC<CommentSectionProps> = ({ articleId, artic
     fetchComments();
   }, [articleId]);
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+
+    setIsLoadingMore(true);
+    setError(null);
+    try {
+      const page = await userService.getComments(articleId, nextCursor);
+      setComments(prev => [
+        ...prev,
+        ...page.comments.filter(c => !prev.some(p => p.id === c.id)),
+      ]);
+      setNextCursor(page.nextCursor);
+    } catch (err: any) {
+      setError(err.message || 'Failed to load comments');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
     if (!newComment.trim()) return;
@@ -97,24 +120,33 @@ export const CommentSection: React.FC<CommentSectionProps> = ({ articleId, artic
             <p className="text-slate-500 dark:text-slate-400 text-sm">{error}</p>
           </div>
         ) : comments.length > 0 ? (
-          comments.map((comment) => (
-            <div key={comment.id} className="flex gap-4 animate-fade-in">
-              <div className="w-10 h-10 rounded-full bg-indigo-100 dark:bg-indigo-900/30 flex items-center justify-center font-bold text-indigo-600">
-                {comment.username && comment.username.length > 0 ? comment.username[0] : 'U'}
-              </div>
-              <div className="flex-1">
-                <div className="flex items-center gap-2 mb-1">
-                  <span className="font-bold text-sm">{comment.username || 'Anonymous'}</span>
-                  <span className="text-[10px] text-slate-400">
-                    {new Date(comment.created_at).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}
-                  </span>
+          <>
+            {comments.map((comment) => (
+              <div key={comment.id} className="flex gap-4 animate-fade-in">
+                <div className="w-10 h-10 rounded-full bg-indigo-100 dark:bg-indigo-900/30 flex items-center justify-center font-bold text-indigo-600">
+                  {comment.username && comment.username.length > 0 ? comment.username[0] : 'U'}
+                </div>
+                <div className="flex-1">
+                  <div className="flex items-center gap-2 mb-1">
+                    <span className="font-bold text-sm">{comment.username || 'Anonymous'}</span>
+                    <span className="text-[10px] text-slate-400">
+                      {new Date(comment.created_at).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}
+                    </span>
+                  </div>
+                  <p className="text-sm text-slate-600 dark:text-slate-400">
+                    {comment.text}
+                  </p>
                 </div>
-                <p className="text-sm text-slate-600 dark:text-slate-400">
-                  {comment.text}
-                </p>
               </div>
-            </div>
-          ))
+            ))}
+            {nextCursor && (
+              <div className="flex justify-center pt-2">
+                <Button variant="ghost" size="sm" onClick={handleLoadMore} isLoading={isLoadingMore} disabled={isLoadingMore}>
+                  Load older comments
+                </Button>
+              </div>
+            )}
+          </>
         ) : (
           <p className="text-center text-slate-400 py-4 text-sm italic">No comments yet.</p>
         )}
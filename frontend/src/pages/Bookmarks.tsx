@@ -7,16 +7,26 @@ import { Button } from '../components/ui/Button';
 export const Bookmarks: React.FC = () => {
   const [bookmarks, setBookmarks] = useState<Bookmark[]>([]);
   const [isLoading, setIsLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  // Total saved, from profile stats (the list itself is loaded a page at a time)
+  const [total, setTotal] = useState<number | null>(null);
 
   useEffect(() => {
     const fetch = async () => {
       setIsLoading(true);
       try {
-        const data = await userService.getBookmarks();
-        setBookmarks(data);
+        const [page, stats] = await Promise.all([
+          userService.getBookmarks(),
+          userService.getProfileStats().catch(() => null),
+        ]);
+        setBookmarks(page.bookmarks);
+        setNextCursor(page.nextCursor);
+        setTotal(stats ? stats.bookmarks : null);
       } catch (err) {
         console.error('Failed to fetch bookmarks:', err);
         setBookmarks([]);
+        setNextCursor(null);
       } finally {
         setIsLoading(false);
       }
@@ -24,10 +34,29 @@ export const Bookmarks: React.FC = () => {
     fetch();
   }, []);
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+
+    setIsLoadingMore(true);
+    try {
+      const page = await userService.getBookmarks(nextCursor);
+      setBookmarks(prev => [
+        ...prev,
+        ...page.bookmarks.filter(item => !prev.some(p => p.id === item.id)),
+      ]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error(err);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const handleRemove = async (id: string) => {
     try {
       await userService.removeBookmark(id);
       setBookmarks(prev => prev.filter(b => b.id !== id));
+      setTotal(prev => (prev === null ? null : Math.max(prev - 1, 0)));
     } catch (err) {
       console.error(err);
     }
@@ -37,7 +66,7 @@ export const Bookmarks: React.FC = () => {
     <div className="w-full max-w-[calc(100vw-120px)] lg:max-w-[calc(100vw-140px)] px-4 md:px-8 py-12 animate-fade-in">
       <h2 className="text-3xl font-black mb-8 flex items-center gap-4">
         🔖 Saved Stories
-        <span className="text-sm font-bold bg-slate-100 dark:bg-slate-800 px-3 py-1 rounded-full text-slate-500">{bookmarks.length}</span>
+        <span className="text-sm font-bold bg-slate-100 dark:bg-slate-800 px-3 py-1 rounded-full text-slate-500">{total ?? bookmarks.length}</span>
       </h2>
 
       <div className="space-y-4">
@@ -76,6 +105,14 @@ export const Bookmarks: React.FC = () => {
           </div>
         )}
       </div>
+
+      {!isLoading && nextCursor && (
+        <div className="flex justify-center mt-8">
+          <Button variant="outline" onClick={handleLoadMore} isLoading={isLoadingMore} disabled={isLoadingMore}>
+            Load more
+          </Button>
+        </div>
+      )}
     </div>
   );
 };
\ No newline at end of file
@@ -28,15 +28,37 @@ export interface ProfileAnalyticsResponse {
   };
 }
 
+export interface CommentsPage {
+  comments: Comment[];
+  nextCursor: string | null;
+}
+
+export interface BookmarksPage {
+  bookmarks: Bookmark[];
+  nextCursor: string | null;
+}
+
+export interface ReadLaterPage {
+  items: ReadLaterItem[];
+  nextCursor: string | null;
+}
+
 export const userService = {
   // Bookmarks
-  getBookmarks: async (): Promise<Bookmark[]> => {
+  // One page of bookmarks, newest first; pass nextCursor back to load older ones
+  getBookmarks: async (cursor?: string | null): Promise<BookmarksPage> => {
     try {
-      const response = await api.get<{ bookmarks: any[]; count: number }>('/api/bookmarks/');
-      return response.data.bookmarks.map(b => ({
-        ...b,
-        id: b._id || b.id
-      }));
+      const response = await api.get<{ bookmarks: any[]; count: number; next_cursor: string | null }>(
+        '/api/bookmarks/',
+        { params: cursor ? { cursor } : undefined }
+      );
+      return {
+        bookmarks: response.data.bookmarks.map(b => ({
+          ...b,
+          id: b._id || b.id
+        })),
+        nextCursor: response.data.next_cursor ?? null,
+      };
     } catch (err) {
       throw new Error(getErrorMessage(err));
     }
@@ -58,13 +80,20 @@ export const userService = {
   },
 
   // Read Later
-  getReadLater: async (): Promise<ReadLaterItem[]> => {
+  // One page of read-later items, newest first; pass nextCursor back to load older ones
+  getReadLater: async (cursor?: string | null): Promise<ReadLaterPage> => {
     try {
-      const response = await api.get<{ items: any[]; count: number }>('/api/read-later/');
-      return response.data.items.map(i => ({
-        ...i,
-        id: i._id || i.id
-      }));
+      const response = await api.get<{ items: any[]; count: number; next_cursor: string | null }>(
+        '/api/read-later/',
+        { params: cursor ? { cursor } : undefined }
+      );
+      return {
+        items: response.data.items.map(i => ({
+          ...i,
+          id: i._id || i.id
+        })),
+        nextCursor: response.data.next_cursor ?? null,
+      };
     } catch (err) {
       throw new Error(getErrorMessage(err));
     }
@@ -86,18 +115,25 @@ export const userService = {
   },
 
   // Comments
-  getComments: async (articleId: string): Promise<Comment[]> => {
+  // One page of comments, newest first; pass nextCursor back to load older ones
+  getComments: async (articleId: string, cursor?: string | null): Promise<CommentsPage> => {
     try {
-      const response = await api.get<{ comments: any[]; count: number }>(`/api/comments/${articleId}`);
-      return response.data.comments.map(c => ({
-        id: c.id || c._id,
-        article_id: c.article_id,
-        article_title: c.article_title,
-        text: c.text,
-        user_id: c.user_id,
-        username: c.username,
-        created_at: c.created_at,
-      }));
+      const response = await api.get<{ comments: any[]; count: number; next_cursor: string | null }>(
+        `/api/comments/${articleId}`,
+        { params: cursor ? { cursor } : undefined }
+      );
+      return {
+        comments: response.data.comments.map(c => ({
+          id: c.id || c._id,
+          article_id: c.article_id,
+          article_title: c.article_title,
+          text: c.text,
+          user_id: c.user_id,
+          username: c.username,
+          created_at: c.created_at,
+        })),
+        nextCursor: response.data.next_cursor ?? null,
+      };
     } catch (err) {
       throw new Error(getErrorMessage(err));
     }